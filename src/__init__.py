@@ -16,7 +16,9 @@ __author__ = "Temkit Sid-Ali"
 __email__ = "contact@yet.lu"
 __license__ = "MIT"
 
-from .models.architecture import OMNI_LLM_ARCHITECTURE, OmniLLMArchitecture
+from typing import Any
+
+from .models import architecture
 
 __all__ = [
     "OMNI_LLM_ARCHITECTURE",
@@ -25,4 +27,11 @@ __all__ = [
     "__author__",
     "__email__",
     "__license__"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    # The default architecture is built on first access, not at import
+    if name in ("OMNI_LLM_ARCHITECTURE", "OmniLLMArchitecture"):
+        return getattr(architecture, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,15 +3,27 @@ Omni-LLM Core Module
 ===================
 
 Core functionality for request routing, validation, and processing.
+
+RequestRouter is loaded on first access, so importing validators or
+exceptions does not pull in LangChain and the provider SDKs.
 """
 
-from .router import RequestRouter
-from .validators import validate_request
+from typing import Any
+
+from .validators import validate_request, validate_requests
 from .exceptions import OmniLLMError, ValidationError
 
 __all__ = [
     "RequestRouter",
     "validate_request", 
+    "validate_requests",
     "OmniLLMError",
     "ValidationError"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "RequestRouter":
+        from .router import RequestRouter
+        return RequestRouter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,12 +5,23 @@ Omni-LLM Exception Classes
 Custom exception classes for error handling throughout the system.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Type
+
+
+def _rebuild_error(cls: Type["OmniLLMError"], args: Tuple[Any, ...], state: Dict[str, Any]) -> "OmniLLMError":
+    """Recreate a pickled error without re-running its constructor."""
+    error = cls.__new__(cls)
+    error.args = args
+    for name, value in state.items():
+        setattr(error, name, value)
+    return error
 
 
 class OmniLLMError(Exception):
     """Base exception class for Omni-LLM errors."""
     
+    __slots__ = ("message", "error_code", "status_code", "details")
+    
     def __init__(
         self,
         message: str,
@@ -23,11 +34,23 @@ class OmniLLMError(Exception):
         self.error_code = error_code
         self.status_code = status_code
         self.details = details or {}
+    
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle slot attributes, which the default exception reduce omits."""
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if hasattr(self, name)
+        }
+        return _rebuild_error, (type(self), self.args, state)
 
 
 class ValidationError(OmniLLMError):
     """Exception raised for request validation errors."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(
             message=message,
@@ -40,6 +63,8 @@ class ValidationError(OmniLLMError):
 class ProviderError(OmniLLMError):
     """Exception raised for LLM provider errors."""
     
+    __slots__ = ("provider", "model")
+    
     def __init__(
         self,
         message: str,
@@ -61,6 +86,8 @@ class ProviderError(OmniLLMError):
 class AuthenticationError(OmniLLMError):
     """Exception raised for authentication errors."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str = "Authentication failed"):
         super().__init__(
             message=message,
@@ -72,31 +99,48 @@ class AuthenticationError(OmniLLMError):
 class RateLimitError(OmniLLMError):
     """Exception raised for rate limit errors."""
     
-    def __init__(self, message: str = "Rate limit exceeded"):
+    __slots__ = ()
+    
+    def __init__(self, message: str = "Rate limit exceeded", details: Optional[Dict[str, Any]] = None):
         super().__init__(
             message=message,
             error_code="RATE_LIMIT_ERROR",
-            status_code=429
+            status_code=429,
+            details=details
         )
 
 
 class TimeoutError(OmniLLMError):
     """Exception raised for timeout errors."""
     
-    def __init__(self, message: str = "Request timeout"):
+    __slots__ = ()
+    
+    def __init__(self, message: str = "Request timeout", details: Optional[Dict[str, Any]] = None):
         super().__init__(
             message=message,
             error_code="TIMEOUT_ERROR",
-            status_code=504
+            status_code=504,
+            details=details
         )
 
 
 class ConfigurationError(OmniLLMError):
     """Exception raised for configuration errors."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str):
         super().__init__(
             message=message,
             error_code="CONFIGURATION_ERROR",
             status_code=500
-        )
\ No newline at end of file
+        )
+
+
+# Exception to raise for upstream HTTP statuses that mean more than a
+# generic provider failure; anything else surfaces as ProviderError
+HTTP_STATUS_ERRORS: Dict[int, Type[OmniLLMError]] = {
+    408: TimeoutError,
+    429: RateLimitError,
+    504: TimeoutError,
+}
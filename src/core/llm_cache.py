@@ -0,0 +1,184 @@
+"""
+Omni-LLM Response Cache
+=======================
+
+Exact-match cache for deterministic LLM responses, placed in front of the
+provider so repeated identical requests skip the network call entirely.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Protocol, Tuple
+
+import orjson
+
+from ..models.architecture import RequestSchema
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Storage backend for cached responses."""
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for a key, or None if missing or expired."""
+        ...
+
+    def set(self, key: str, value: Dict[str, Any], ttl_seconds: int) -> None:
+        """Store a value for a key with the given TTL."""
+        ...
+
+
+class MemoryCacheBackend:
+    """
+    In-process LRU cache backend with per-entry expiry.
+
+    Entries live for the lifetime of the Lambda container, so warm
+    invocations share the cache.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the memory backend.
+
+        Args:
+            max_entries: Maximum number of entries before LRU eviction
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for a key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Dict[str, Any], ttl_seconds: int) -> None:
+        """Store a value for a key with the given TTL."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class LLMCache:
+    """
+    Response cache for deterministic LLM requests.
+
+    Only requests that should produce the same output every time are cached:
+    temperature 0, non-streaming, with caching enabled on the request. Error
+    results and empty responses are never stored.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: int):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend
+            ttl_seconds: Time-to-live for cached responses
+        """
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def is_cacheable(request: RequestSchema) -> bool:
+        """Check whether a request is deterministic and opted in to caching."""
+        return request.cache_enabled and request.temperature == 0 and not request.stream
+
+    @staticmethod
+    def make_key(request: RequestSchema) -> str:
+        """
+        Build the cache key for a request.
+
+        The key is a SHA-256 digest of every field that can change the
+        generated output, serialized as compact JSON with sorted keys.
+
+        Args:
+            request: Validated request schema
+
+        Returns:
+            Hex digest cache key
+        """
+        payload = request.model_dump(
+            mode="json",
+            include={
+                "prompt",
+                "system_prompt",
+                "model_name",
+                "provider_preference",
+                "enable_fallback",
+                "fallback_strategy",
+                "max_tokens",
+                "top_p",
+                "top_k",
+                "rag_enabled",
+                "s3_bucket",
+                "vector_store_type",
+                "embedding_model",
+                "retrieval_top_k",
+                "mcp_enabled",
+                "mcp_servers",
+                "mcp_tools",
+                "structured_output_enabled",
+                "structured_output_schema",
+            }
+        )
+        serialized = orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(serialized).hexdigest()
+
+    def get(self, request: RequestSchema) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response for a request.
+
+        Args:
+            request: Validated request schema
+
+        Returns:
+            Cached provider response data, or None on a miss
+        """
+        if not self.is_cacheable(request):
+            return None
+
+        cached = self.backend.get(self.make_key(request))
+        if cached is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return cached
+
+    def set(self, request: RequestSchema, response_data: Dict[str, Any]) -> None:
+        """
+        Store a provider response for a request.
+
+        Args:
+            request: Validated request schema
+            response_data: Provider response data
+        """
+        if not self.is_cacheable(request):
+            return
+
+        if not response_data.get("content"):
+            logger.debug("Not caching empty response")
+            return
+
+        # Attempts belong to the original request, not to later cache hits
+        cached = {key: value for key, value in response_data.items() if key != "fallback_attempts"}
+        self.backend.set(self.make_key(request), cached, self.ttl_seconds)
@@ -7,16 +7,20 @@ with automatic fallback support.
 """
 
 import logging
+import time
 from typing import Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
-from .exceptions import ProviderError, ConfigurationError
+from .exceptions import OmniLLMError, ProviderError, ConfigurationError
+from .llm_cache import LLMCache, MemoryCacheBackend
 from ..models.architecture import RequestSchema
-from ..providers.langchain_provider import LangChainProvider
 from ..utils.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Provider response keys copied to the top level of the response when present
+_OPTIONAL_RESPONSE_KEYS = ("structured_data", "rag_context", "tool_calls")
+
 
 class RequestRouter:
     """
@@ -35,10 +39,14 @@ class RequestRouter:
         """
         self.config = config
         self.provider = None
+        self.response_cache = LLMCache(MemoryCacheBackend(), ttl_seconds=config.cache_ttl)
         self._initialize_provider()
     
     def _initialize_provider(self) -> None:
         """Initialize the LangChain universal provider."""
+        # Imported here so loading the router module stays cheap
+        from ..providers.langchain_provider import LangChainProvider
+        
         try:
             self.provider = LangChainProvider(self.config)
             logger.info("LangChain universal provider initialized successfully")
@@ -60,14 +68,29 @@ class RequestRouter:
         
         Raises:
             ProviderError: If request processing fails
+            RateLimitError: If the upstream provider rate-limited the request
+            TimeoutError: If the upstream provider timed out
         """
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         
         logger.info(f"Processing request {request_id} through LangChain provider")
         
         try:
-            # Process request through LangChain provider
-            response_data = self.provider.process_request(request, request_id)
+            # Serve deterministic repeats from the response cache
+            cached = self.response_cache.get(request)
+            cache_hit = cached is not None
+            response_data: Dict[str, Any]
+            
+            if cached is not None:
+                response_data = cached
+                logger.info(f"Request {request_id} served from response cache")
+            else:
+                # Process request through LangChain provider
+                response_data = self.provider.process_request(request, request_id)
+                self.response_cache.set(request, response_data)
+            
+            fallback_attempts = response_data.get("fallback_attempts", [])
+            provider_used = response_data.get("provider_used", "unknown")
             
             # Build final response
             response = {
@@ -79,56 +102,41 @@ class RequestRouter:
                 },
                 "metadata": {
                     "model_used": response_data.get("model_used", "unknown"),
-                    "provider": response_data.get("provider_used", "unknown").value if hasattr(response_data.get("provider_used"), 'value') else str(response_data.get("provider_used", "unknown")),
+                    "provider": getattr(provider_used, "value", provider_used),
                     "usage": {
                         "prompt_tokens": response_data.get("prompt_tokens", 0),
                         "completion_tokens": response_data.get("completion_tokens", 0),
                         "total_tokens": response_data.get("total_tokens", 0),
-                        "cost_usd": response_data.get("total_cost", 0.0)
+                        # A cache hit makes no provider call, so nothing is spent
+                        "cost_usd": 0.0 if cache_hit else response_data.get("total_cost", 0.0)
                     },
-                    "execution_time": response_data.get("total_latency", 0.0),
-                    "provider_latency": response_data.get("provider_latency", 0.0),
+                    # A cache hit reports the router's own time, not the original call's
+                    "execution_time": (
+                        time.perf_counter() - start_time if cache_hit else response_data.get("total_latency", 0.0)
+                    ),
+                    "provider_latency": 0.0 if cache_hit else response_data.get("provider_latency", 0.0),
                     "request_id": request_id,
-                    "fallback_attempts": len(response_data.get("fallback_attempts", [])),
-                    "providers_tried": [
-                        {
-                            "provider": attempt.provider.value if hasattr(attempt.provider, 'value') else str(attempt.provider),
-                            "model": attempt.model,
-                            "success": attempt.success,
-                            "latency": attempt.latency,
-                            "cost": attempt.cost,
-                            "error": attempt.error
-                        }
-                        for attempt in response_data.get("fallback_attempts", [])
-                    ]
+                    "cache_hit": cache_hit,
+                    "fallback_attempts": len(fallback_attempts),
+                    "providers_tried": [attempt.to_summary() for attempt in fallback_attempts]
                 },
-                "error": None
+                "error": None,
+                # Add structured data, RAG context and tool calls if present
+                **{key: response_data[key] for key in _OPTIONAL_RESPONSE_KEYS if key in response_data}
             }
             
-            # Add structured data if present
-            if "structured_data" in response_data:
-                response["structured_data"] = response_data["structured_data"]
-            
-            # Add RAG context if present
-            if "rag_context" in response_data:
-                response["rag_context"] = response_data["rag_context"]
-            
-            # Add tool calls if present
-            if "tool_calls" in response_data:
-                response["tool_calls"] = response_data["tool_calls"]
-            
-            execution_time = (datetime.utcnow() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             response["metadata"]["total_execution_time"] = execution_time
             
             logger.info(f"Request {request_id} processed successfully in {execution_time:.2f}s")
-            logger.info(f"Used provider: {response_data.get('provider_used')}, model: {response_data.get('model_used')}")
+            logger.info(f"Used provider: {provider_used}, model: {response_data.get('model_used')}")
             
-            if response_data.get("fallback_attempts"):
-                logger.info(f"Fallback attempts: {len(response_data['fallback_attempts'])}")
+            if fallback_attempts:
+                logger.info(f"Fallback attempts: {len(fallback_attempts)}")
             
             return response
             
-        except ProviderError:
+        except OmniLLMError:
             raise
         except Exception as e:
             logger.error(f"Unexpected error processing request {request_id}: {e}")
@@ -150,9 +158,11 @@ class RequestRouter:
                 return {
                     "healthy": False,
                     "error": "LangChain provider not initialized",
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": datetime.now(timezone.utc).isoformat()
                 }
             
+            # Provider health is read from circuit state, so it is never cached:
+            # a cached result could hide an outage for the whole cooldown
             provider_health = self.provider.health_check()
             
             # Enhance with router-level information
@@ -160,7 +170,8 @@ class RequestRouter:
                 "healthy": provider_health.get("healthy", False),
                 "router": "langchain_universal",
                 "provider_details": provider_health,
-                "timestamp": datetime.utcnow().isoformat()
+                "response_cache": dict(self.response_cache.stats),
+                "timestamp": datetime.now(timezone.utc).isoformat()
             }
             
             return result
@@ -170,5 +181,5 @@ class RequestRouter:
             return {
                 "healthy": False,
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
-            }
\ No newline at end of file
+                "timestamp": datetime.now(timezone.utc).isoformat()
+            }
@@ -5,19 +5,62 @@ Omni-LLM Request Validators - LangChain Based
 Request validation and sanitization functions for LangChain provider.
 """
 
-from typing import Dict, Any
-from pydantic import ValidationError as PydanticValidationError
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple, Union
+
+import orjson
+from pydantic import TypeAdapter, ValidationError as PydanticValidationError
 
 from .exceptions import ValidationError
-from ..models.architecture import RequestSchema, LLMProvider
+from ..models.architecture import (
+    RequestSchema,
+    LLMProvider,
+    ModelConfiguration,
+    get_langchain_model_catalog
+)
+
+
+def _build_provider_models(catalog: Tuple[ModelConfiguration, ...]) -> Dict[LLMProvider, FrozenSet[str]]:
+    """Build the provider -> model names lookup table from the model catalog."""
+    provider_models: Dict[LLMProvider, List[str]] = {}
+    for model in catalog:
+        provider_models.setdefault(model.provider, []).append(model.name)
+    return {provider: frozenset(names) for provider, names in provider_models.items()}
+
+
+# Catalog lookup tables, built once at import instead of on every request
+_CATALOG = get_langchain_model_catalog()
+_MODEL_NAMES = [model.name for model in _CATALOG]
+_PROVIDER_MODELS: Dict[LLMProvider, FrozenSet[str]] = _build_provider_models(_CATALOG)
+_AVAILABLE_MODELS: FrozenSet[str] = frozenset(_MODEL_NAMES)
+_AVAILABLE_MODELS_MSG = ", ".join(_MODEL_NAMES[:10]) + ("..." if len(_MODEL_NAMES) > 10 else "")
+_AVAILABLE_PROVIDERS_MSG = ", ".join(provider.value for provider in _PROVIDER_MODELS)
+
+# Vector stores accepted for RAG requests, in the order listed in error messages
+_SUPPORTED_VECTOR_STORES = ("chroma", "pinecone", "opensearch", "faiss", "weaviate", "qdrant")
+_SUPPORTED_VECTOR_STORES_SET: FrozenSet[str] = frozenset(_SUPPORTED_VECTOR_STORES)
+_SUPPORTED_VECTOR_STORES_MSG = ", ".join(_SUPPORTED_VECTOR_STORES)
+
+# Maximum size of a structured output schema as compact JSON (10KB)
+_MAX_STRUCTURED_OUTPUT_SCHEMA_SIZE = 10000
+
+# Validator for batch bodies, built once since TypeAdapter construction is costly
+_REQUEST_LIST_ADAPTER = TypeAdapter(List[RequestSchema])
 
+# Shortest accepted API key. Only the length is checked, since issued keys
+# may use any alphabet, including base64 characters such as "+", "/" and "="
+_API_KEY_MIN_LENGTH = 8
 
-def validate_request(request_data: Dict[str, Any]) -> RequestSchema:
+
+def validate_request(request_data: Union[str, bytes, Dict[str, Any]]) -> RequestSchema:
     """
     Validate and parse incoming request data for LangChain provider.
     
+    Raw JSON bodies are validated directly by pydantic-core, without first
+    being decoded into an intermediate dictionary.
+    
     Args:
-        request_data: Raw request data dictionary
+        request_data: Raw JSON request body, or an already decoded dictionary
     
     Returns:
         Validated RequestSchema object
@@ -27,94 +70,164 @@ def validate_request(request_data: Dict[str, Any]) -> RequestSchema:
     """
     try:
         # Parse with Pydantic model
-        request = RequestSchema(**request_data)
+        if isinstance(request_data, (str, bytes)):
+            request = RequestSchema.model_validate_json(request_data)
+        else:
+            request = RequestSchema.model_validate(request_data)
         
         # Additional business logic validation
-        _validate_model_availability(request)
-        _validate_fallback_config(request)
-        _validate_rag_config(request)
-        _validate_mcp_config(request)
-        _validate_structured_output(request)
+        _validate_business_rules(request)
         
         return request
         
     except PydanticValidationError as e:
-        error_details = []
-        for error in e.errors():
-            field_path = " -> ".join(str(loc) for loc in error['loc'])
-            error_details.append(f"{field_path}: {error['msg']}")
-        
-        raise ValidationError(
-            f"Request validation failed: {'; '.join(error_details)}",
-            details={"validation_errors": e.errors()}
-        )
+        raise _translate_pydantic_error(e)
+    except ValidationError:
+        raise
     except Exception as e:
         raise ValidationError(f"Request validation error: {str(e)}")
 
 
-def _validate_model_availability(request: RequestSchema) -> None:
+def validate_requests(
+    request_data: Union[str, bytes, List[Dict[str, Any]]],
+    max_batch_size: int
+) -> List[RequestSchema]:
     """
-    Validate that requested models/providers are available.
+    Validate and parse a batch of requests sent as a JSON array.
+    
+    The whole array is validated by one prebuilt TypeAdapter, and every
+    entry must pass, so an invalid entry rejects the batch before any
+    provider call is made.
     
     Args:
-        request: The request schema
+        request_data: Raw JSON array body, or an already decoded list
+        max_batch_size: Maximum number of requests in a batch
+    
+    Returns:
+        Validated RequestSchema objects, in input order
     
     Raises:
-        ValidationError: If model/provider combination is invalid
+        ValidationError: If the batch or any request in it is invalid
     """
-    # Get available models from catalog
-    from ..models.architecture import get_langchain_model_catalog
+    try:
+        if isinstance(request_data, (str, bytes)):
+            requests = _REQUEST_LIST_ADAPTER.validate_json(request_data)
+        else:
+            requests = _REQUEST_LIST_ADAPTER.validate_python(request_data)
+    except PydanticValidationError as e:
+        raise _translate_pydantic_error(e)
     
-    catalog = get_langchain_model_catalog()
-    available_models = {model.name: model for model in catalog}
+    if not requests:
+        raise ValidationError("Batch must contain at least one request")
     
-    # Validate specific model if requested
-    if request.model_name:
-        if request.model_name not in available_models:
-            available_model_names = list(available_models.keys())
-            raise ValidationError(
-                f"Model '{request.model_name}' is not available. "
-                f"Available models: {', '.join(available_model_names[:10])}{'...' if len(available_model_names) > 10 else ''}"
-            )
+    if len(requests) > max_batch_size:
+        raise ValidationError(f"Batch cannot exceed {max_batch_size} requests")
     
-    # Validate provider preferences
-    if request.provider_preference:
-        available_providers = set(model.provider for model in catalog)
-        
-        for provider in request.provider_preference:
-            if provider not in available_providers:
-                raise ValidationError(
-                    f"Provider '{provider.value}' is not available. "
-                    f"Available providers: {', '.join(p.value for p in available_providers)}"
-                )
+    for index, request in enumerate(requests):
+        try:
+            _validate_business_rules(request)
+        except ValidationError as e:
+            raise ValidationError(f"Request {index}: {e.message}", details=e.details)
+    
+    return requests
+
 
+def _translate_pydantic_error(e: PydanticValidationError) -> ValidationError:
+    """Convert a Pydantic validation error into an Omni-LLM ValidationError."""
+    errors = e.errors(include_url=False, include_context=False)
+    
+    if any(error['type'] == 'json_invalid' for error in errors):
+        return ValidationError("Invalid JSON in request body")
+    
+    error_details = []
+    for error in errors:
+        field_path = " -> ".join(str(loc) for loc in error['loc'])
+        error_details.append(f"{field_path}: {error['msg']}")
+    
+    return ValidationError(
+        f"Request validation failed: {'; '.join(error_details)}",
+        details={"validation_errors": errors}
+    )
 
-def _validate_fallback_config(request: RequestSchema) -> None:
+
+def _validate_business_rules(request: RequestSchema) -> None:
     """
-    Validate fallback configuration.
+    Run the cross-field business rules on a parsed request in a single pass.
+    
+    Fields used by several rules are read once, and the RAG, MCP and
+    structured output checks only run when their feature is enabled.
     
     Args:
         request: The request schema
     
     Raises:
-        ValidationError: If fallback config is invalid
+        ValidationError: If any business rule is violated
     """
-    if request.max_fallback_attempts < 1:
-        raise ValidationError("max_fallback_attempts must be at least 1")
+    model_name = request.model_name
+    provider_preference = request.provider_preference
     
-    if request.max_fallback_attempts > 10:
-        raise ValidationError("max_fallback_attempts cannot exceed 10")
+    # Validate that requested models/providers are available
+    _validate_model_selection(model_name, tuple(provider_preference) if provider_preference else None)
+    
+    # Validate fallback configuration
+    max_fallback_attempts = request.max_fallback_attempts
+    if not 1 <= max_fallback_attempts <= 10:
+        raise ValidationError(f"max_fallback_attempts must be between 1 and 10, got {max_fallback_attempts}")
     
     # If fallback is disabled but specific model not provided, that could be problematic
-    if not request.enable_fallback and not request.model_name and not request.provider_preference:
+    if not request.enable_fallback and not model_name and not provider_preference:
         raise ValidationError(
             "When fallback is disabled, you must specify either model_name or provider_preference"
         )
+    
+    if request.rag_enabled:
+        _validate_rag_config(request)
+    
+    if request.mcp_enabled:
+        _validate_mcp_config(request)
+    
+    if request.structured_output_enabled:
+        _validate_structured_output(request)
+
+
+@lru_cache(maxsize=512)
+def _validate_model_selection(
+    model_name: Optional[str],
+    provider_preference: Optional[Tuple[str, ...]]
+) -> None:
+    """
+    Validate a model/provider selection against the catalog.
+    
+    Memoized per combination, since the same selections repeat across
+    requests; invalid selections raise and are therefore never cached.
+    
+    Args:
+        model_name: Requested model name
+        provider_preference: Preferred providers in order
+    
+    Raises:
+        ValidationError: If model/provider combination is invalid
+    """
+    # Validate specific model if requested
+    if model_name and model_name not in _AVAILABLE_MODELS:
+        raise ValidationError(
+            f"Model '{model_name}' is not available. "
+            f"Available models: {_AVAILABLE_MODELS_MSG}"
+        )
+    
+    # Validate provider preferences
+    if provider_preference:
+        for provider in provider_preference:
+            if provider not in _PROVIDER_MODELS:
+                raise ValidationError(
+                    f"Provider '{provider}' is not available. "
+                    f"Available providers: {_AVAILABLE_PROVIDERS_MSG}"
+                )
 
 
 def _validate_rag_config(request: RequestSchema) -> None:
     """
-    Validate RAG configuration if enabled.
+    Validate RAG configuration of a request with RAG enabled.
     
     Args:
         request: The request schema
@@ -122,9 +235,6 @@ def _validate_rag_config(request: RequestSchema) -> None:
     Raises:
         ValidationError: If RAG config is invalid
     """
-    if not request.rag_enabled:
-        return
-    
     if not request.s3_bucket:
         raise ValidationError("s3_bucket is required when RAG is enabled")
     
@@ -132,11 +242,10 @@ def _validate_rag_config(request: RequestSchema) -> None:
         raise ValidationError("vector_store_type is required when RAG is enabled")
     
     # Validate vector store type
-    supported_vector_stores = ["chroma", "pinecone", "opensearch", "faiss", "weaviate", "qdrant"]
-    if request.vector_store_type not in supported_vector_stores:
+    if request.vector_store_type not in _SUPPORTED_VECTOR_STORES_SET:
         raise ValidationError(
             f"vector_store_type '{request.vector_store_type}' not supported. "
-            f"Supported types: {', '.join(supported_vector_stores)}"
+            f"Supported types: {_SUPPORTED_VECTOR_STORES_MSG}"
         )
     
     if request.retrieval_top_k < 1:
@@ -148,7 +257,7 @@ def _validate_rag_config(request: RequestSchema) -> None:
 
 def _validate_mcp_config(request: RequestSchema) -> None:
     """
-    Validate MCP configuration if enabled.
+    Validate MCP configuration of a request with MCP enabled.
     
     Args:
         request: The request schema
@@ -156,9 +265,6 @@ def _validate_mcp_config(request: RequestSchema) -> None:
     Raises:
         ValidationError: If MCP config is invalid
     """
-    if not request.mcp_enabled:
-        return
-    
     if not request.mcp_servers:
         raise ValidationError("mcp_servers list cannot be empty when MCP is enabled")
     
@@ -181,7 +287,7 @@ def _validate_mcp_config(request: RequestSchema) -> None:
 
 def _validate_structured_output(request: RequestSchema) -> None:
     """
-    Validate structured output configuration.
+    Validate structured output configuration of a request with it enabled.
     
     Args:
         request: The request schema
@@ -189,9 +295,6 @@ def _validate_structured_output(request: RequestSchema) -> None:
     Raises:
         ValidationError: If structured output config is invalid
     """
-    if not request.structured_output_enabled:
-        return
-    
     if not request.structured_output_schema:
         raise ValidationError("structured_output_schema is required when structured_output_enabled is True")
     
@@ -203,13 +306,11 @@ def _validate_structured_output(request: RequestSchema) -> None:
         raise ValidationError("structured_output_schema cannot be empty")
     
     # Check for reasonable schema size (prevent abuse)
-    import json
-    schema_str = json.dumps(request.structured_output_schema)
-    if len(schema_str) > 10000:  # 10KB limit
+    if len(orjson.dumps(request.structured_output_schema)) > _MAX_STRUCTURED_OUTPUT_SCHEMA_SIZE:
         raise ValidationError("structured_output_schema is too large (max 10KB)")
 
 
-def validate_api_key_format(api_key: str) -> bool:
+def validate_api_key_format(api_key: Optional[str]) -> bool:
     """
     Validate API key format.
     
@@ -222,16 +323,7 @@ def validate_api_key_format(api_key: str) -> bool:
     if not api_key:
         return False
     
-    # Basic format validation
-    if len(api_key) < 8:
-        return False
-    
-    # Must contain alphanumeric characters and hyphens only
-    allowed_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_.')
-    if not all(c in allowed_chars for c in api_key):
-        return False
-    
-    return True
+    return len(api_key) >= _API_KEY_MIN_LENGTH
 
 
 def validate_model_parameters(request: RequestSchema) -> None:
@@ -248,43 +340,37 @@ def validate_model_parameters(request: RequestSchema) -> None:
     if not 0.0 <= request.temperature <= 2.0:
         raise ValidationError("temperature must be between 0.0 and 2.0")
     
-    # Max tokens validation
-    if request.max_tokens < 1:
-        raise ValidationError("max_tokens must be at least 1")
-    
-    if request.max_tokens > 128000:  # Reasonable upper limit
-        raise ValidationError("max_tokens cannot exceed 128,000")
+    # Max tokens validation (128,000 is a reasonable upper limit)
+    if not 1 <= request.max_tokens <= 128000:
+        raise ValidationError("max_tokens must be between 1 and 128,000")
     
     # Top-p validation
     if not 0.0 <= request.top_p <= 1.0:
         raise ValidationError("top_p must be between 0.0 and 1.0")
     
     # Top-k validation
-    if request.top_k is not None:
-        if request.top_k < 1:
-            raise ValidationError("top_k must be at least 1")
-        
-        if request.top_k > 100:
-            raise ValidationError("top_k cannot exceed 100")
+    top_k = request.top_k
+    if top_k is not None and not 1 <= top_k <= 100:
+        raise ValidationError("top_k must be between 1 and 100")
     
     # Timeout validation
     if not 1 <= request.timeout <= 900:
         raise ValidationError("timeout must be between 1 and 900 seconds")
 
 
+@lru_cache(maxsize=1)
 def get_supported_models() -> Dict[str, Any]:
     """
     Get list of supported models and their capabilities.
     
+    The catalog is static, so the payload is built once and the same
+    dictionary is returned on every call; callers must not mutate it.
+    
     Returns:
         Dictionary of supported models and metadata
     """
-    from ..models.architecture import get_langchain_model_catalog
-    
-    catalog = get_langchain_model_catalog()
-    
-    models_by_provider = {}
-    for model in catalog:
+    models_by_provider: Dict[str, List[Dict[str, Any]]] = {}
+    for model in _CATALOG:
         provider_name = model.provider.value
         if provider_name not in models_by_provider:
             models_by_provider[provider_name] = []
@@ -301,7 +387,7 @@ def get_supported_models() -> Dict[str, Any]:
         })
     
     return {
-        "total_models": len(catalog),
+        "total_models": len(_CATALOG),
         "providers": len(models_by_provider),
         "models_by_provider": models_by_provider,
         "supported_features": [
@@ -315,4 +401,4 @@ def get_supported_models() -> Dict[str, Any]:
             "rag_integration",
             "mcp_tools"
         ]
-    }
\ No newline at end of file
+    }
@@ -6,34 +6,94 @@ Main AWS Lambda function handler for the Universal AI Gateway.
 Provides unified access to multiple LLM providers through a single API.
 """
 
+import base64
+import binascii
+import hmac
 import json
 import logging
 import os
-import traceback
-from typing import Dict, Any, Optional
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import Dict, Any, FrozenSet, Optional, TypedDict, Union
+from datetime import datetime, timezone
 
-import boto3
+import orjson
 from botocore.exceptions import ClientError
 
 from .core.router import RequestRouter
-from .core.validators import validate_request
+from .core.validators import validate_api_key_format, validate_request, validate_requests
 from .core.exceptions import OmniLLMError, ValidationError
 from .utils.logger import setup_logger
 from .utils.config import Config
-from .models.architecture import RequestSchema, ResponseSchema
+from .models.architecture import RequestSchema
 
 # Setup logging
 logger = setup_logger(__name__)
 
-# Initialize configuration
-config = Config()
+# Headers shared by every API Gateway response; never mutate
+CORS_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,x-api-key',
+    'Access-Control-Allow-Methods': 'OPTIONS,POST,GET',
+    'Access-Control-Max-Age': '86400'
+}
 
-# Initialize request router
-router = RequestRouter(config)
 
+class APIGatewayProxyEvent(TypedDict, total=False):
+    """
+    API Gateway proxy event fields read by the handler.
+    
+    API Gateway sends headers and body as null rather than omitting them,
+    and sets isBase64Encoded for binary payloads.
+    """
+    httpMethod: str
+    path: str
+    headers: Optional[Dict[str, str]]
+    body: Optional[str]
+    isBase64Encoded: bool
+
+
+@cache
+def get_config() -> Config:
+    """Get the shared configuration, loading it on first use."""
+    return Config()
+
+
+@cache
+def get_router() -> RequestRouter:
+    """
+    Get the shared request router, initializing it on first use.
+    
+    Inside Lambda it is built during INIT by _warm_container, so CORS
+    preflights and rejected API keys never pay for provider setup on an
+    invocation, and the router is built once per container.
+    """
+    return RequestRouter(get_config())
+
+
+@cache
+def get_batch_executor() -> ThreadPoolExecutor:
+    """Get the shared pool that processes the requests of a batch concurrently."""
+    return ThreadPoolExecutor(max_workers=get_config().max_batch_size, thread_name_prefix="omni-llm-batch")
+
+
+class _APIKeysCache(TypedDict):
+    """Cached client API keys and the monotonic time they were loaded."""
+    keys: FrozenSet[str]
+    loaded_at: Optional[float]
+    refreshing: bool
+
+
+# Client API keys, refreshed in the background once older than the cache TTL
+_api_keys_cache: _APIKeysCache = {"keys": frozenset(), "loaded_at": None, "refreshing": False}
+_api_keys_lock = threading.Lock()
+_api_keys_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="omni-llm-api-keys")
 
-def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+
+def lambda_handler(event: APIGatewayProxyEvent, context: Any) -> Dict[str, Any]:
     """
     AWS Lambda function handler for Omni-LLM requests.
     
@@ -45,7 +105,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         API Gateway response with CORS headers
     """
     request_id = context.aws_request_id if context else "local"
-    start_time = datetime.utcnow()
+    start_time = time.monotonic()
     
     logger.info(f"Processing request {request_id}")
     
@@ -53,8 +113,22 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Extract request details
         http_method = event.get('httpMethod', 'POST')
         path = event.get('path', '/')
-        headers = event.get('headers', {})
-        body = event.get('body', '{}')
+        headers = event.get('headers') or {}
+        body: Union[str, bytes] = event.get('body') or '{}'
+        if event.get('isBase64Encoded'):
+            try:
+                body = base64.b64decode(body)
+            except (binascii.Error, ValueError) as e:
+                logger.error(f"Invalid base64 body for request {request_id}: {e}")
+                error_response = {
+                    "success": False,
+                    "error": {
+                        "code": "VALIDATION_ERROR",
+                        "message": "Request body is not valid base64",
+                        "request_id": request_id
+                    }
+                }
+                return create_cors_response(400, error_response)
         
         # Log request details (without sensitive data)
         logger.info(f"Method: {http_method}, Path: {path}")
@@ -69,29 +143,23 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             logger.warning(f"Invalid API key for request {request_id}")
             return create_cors_response(401, {"error": "Invalid or missing API key"})
         
-        # Parse request body
-        try:
-            if isinstance(body, str):
-                request_data = json.loads(body) if body else {}
-            else:
-                request_data = body
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in request body: {e}")
-            return create_cors_response(400, {"error": "Invalid JSON in request body"})
+        # A JSON array body is a batch of requests
+        if body.lstrip()[:1] in ('[', b'['):
+            return handle_batch(body, request_id, start_time)
         
-        # Validate request
+        # Parse and validate the raw request body in a single pass
         try:
-            validated_request = validate_request(request_data)
+            validated_request = validate_request(body)
         except ValidationError as e:
             logger.error(f"Request validation failed: {e}")
             return create_cors_response(400, {"error": str(e)})
         
         # Route and process request
         try:
-            response = router.process_request(validated_request, request_id)
+            response = get_router().process_request(validated_request, request_id)
             
             # Calculate execution time
-            execution_time = (datetime.utcnow() - start_time).total_seconds()
+            execution_time = time.monotonic() - start_time
             response['metadata']['execution_time'] = execution_time
             response['metadata']['request_id'] = request_id
             
@@ -112,8 +180,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             return create_cors_response(e.status_code, error_response)
         
     except Exception as e:
-        logger.error(f"Unexpected error for request {request_id}: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Unexpected error for request {request_id}: {e}")
         
         error_response = {
             "success": False,
@@ -126,6 +193,61 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         return create_cors_response(500, error_response)
 
 
+def handle_batch(body: Union[str, bytes], request_id: str, start_time: float) -> Dict[str, Any]:
+    """
+    Validate and process a batch of requests sent as a JSON array.
+    
+    The batch is rejected as a whole if any entry is invalid. Valid batches
+    are routed concurrently, and each entry reports its own result, so one
+    failing provider call does not fail the rest of the batch.
+    
+    Args:
+        body: Raw JSON array request body
+        request_id: Lambda request identifier
+        start_time: Monotonic time the invocation started
+    
+    Returns:
+        API Gateway response with CORS headers
+    """
+    try:
+        validated_requests = validate_requests(body, max_batch_size=get_config().max_batch_size)
+    except ValidationError as e:
+        logger.error(f"Batch validation failed: {e}")
+        return create_cors_response(400, {"error": str(e)})
+    
+    item_ids = [f"{request_id}-{index}" for index in range(len(validated_requests))]
+    responses = list(get_batch_executor().map(_process_batch_item, validated_requests, item_ids))
+    
+    execution_time = time.monotonic() - start_time
+    logger.info(f"Batch {request_id} of {len(responses)} requests completed in {execution_time:.2f}s")
+    
+    return create_cors_response(200, {
+        "success": all(response["success"] for response in responses),
+        "responses": responses,
+        "metadata": {
+            "request_id": request_id,
+            "batch_size": len(responses),
+            "execution_time": execution_time
+        }
+    })
+
+
+def _process_batch_item(request: RequestSchema, request_id: str) -> Dict[str, Any]:
+    """Process one request of a batch, reporting errors in its response."""
+    try:
+        return get_router().process_request(request, request_id)
+    except OmniLLMError as e:
+        logger.error(f"OmniLLM error for request {request_id}: {e}")
+        return {
+            "success": False,
+            "error": {
+                "code": e.error_code,
+                "message": str(e),
+                "request_id": request_id
+            }
+        }
+
+
 def validate_api_key(api_key: Optional[str]) -> bool:
     """
     Validate API key against configured keys or AWS Secrets Manager.
@@ -136,44 +258,83 @@ def validate_api_key(api_key: Optional[str]) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not api_key:
+    # Reject missing and malformed keys before touching the key cache
+    if api_key is None or not validate_api_key_format(api_key):
         return False
     
-    # Get valid API keys from environment or Secrets Manager
-    valid_keys = get_valid_api_keys()
+    # Compare against every key without early exit, so response timing
+    # reveals neither how much of a key matched nor which key it was
+    candidate = api_key.encode()
+    matched = False
+    for valid_key in get_valid_api_keys():
+        matched |= hmac.compare_digest(candidate, valid_key.encode())
+    
+    return matched
+
+
+def get_valid_api_keys() -> FrozenSet[str]:
+    """
+    Get valid API keys, served from a stale-while-revalidate cache.
+    
+    The first call loads the keys synchronously. After that, the cached keys
+    are always returned immediately; once they are older than
+    API_KEYS_CACHE_TTL_SECONDS a single background refresh is started, and
+    if it fails the stale keys stay in use until a later refresh succeeds.
     
-    return api_key in valid_keys
+    Returns:
+        Frozen set of valid API keys
+    """
+    with _api_keys_lock:
+        loaded_at = _api_keys_cache["loaded_at"]
+        if loaded_at is not None:
+            refresh_due = time.monotonic() - loaded_at >= get_config().api_keys_cache_ttl_seconds
+            if refresh_due and not _api_keys_cache["refreshing"]:
+                _api_keys_cache["refreshing"] = True
+                _api_keys_executor.submit(_refresh_api_keys)
+            return _api_keys_cache["keys"]
+    
+    _refresh_api_keys()
+    return _api_keys_cache["keys"]
+
+
+def _refresh_api_keys() -> None:
+    """Reload the API key cache, keeping the current keys if loading fails."""
+    keys = _load_api_keys()
+    
+    with _api_keys_lock:
+        if keys is not None:
+            _api_keys_cache["keys"] = keys
+            _api_keys_cache["loaded_at"] = time.monotonic()
+        _api_keys_cache["refreshing"] = False
 
 
-def get_valid_api_keys() -> set:
+def _load_api_keys() -> Optional[FrozenSet[str]]:
     """
-    Get valid API keys from environment or AWS Secrets Manager.
+    Load valid API keys from environment or AWS Secrets Manager.
     
     Returns:
-        Set of valid API keys
+        Frozen set of valid API keys, or None if they could not be loaded
     """
     # Try environment variable first (for development)
     env_keys = os.getenv('OMNI_LLM_API_KEYS', '')
     if env_keys:
-        return set(key.strip() for key in env_keys.split(',') if key.strip())
+        return frozenset(key.strip() for key in env_keys.split(',') if key.strip())
     
     # Try AWS Secrets Manager
     try:
-        secrets_client = boto3.client('secretsmanager', region_name=config.aws_region)
-        secret_name = config.api_keys_secret_name
-        
-        response = secrets_client.get_secret_value(SecretId=secret_name)
+        config = get_config()
+        response = config.secrets_client.get_secret_value(SecretId=config.api_keys_secret_name)
         secret_data = json.loads(response['SecretString'])
         
         # Expect format: {"api_keys": ["key1", "key2", ...]}
-        return set(secret_data.get('api_keys', []))
+        return frozenset(secret_data.get('api_keys', []))
         
     except ClientError as e:
         logger.warning(f"Could not retrieve API keys from Secrets Manager: {e}")
-        return set()
+        return None
     except Exception as e:
         logger.error(f"Error getting API keys: {e}")
-        return set()
+        return None
 
 
 def create_cors_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
@@ -189,22 +350,36 @@ def create_cors_response(status_code: int, body: Dict[str, Any]) -> Dict[str, An
     """
     return {
         'statusCode': status_code,
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,x-api-key',
-            'Access-Control-Allow-Methods': 'OPTIONS,POST,GET',
-            'Access-Control-Max-Age': '86400'
-        },
-        'body': json.dumps(body, default=str)
+        'headers': CORS_HEADERS,
+        'body': orjson.dumps(body, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
     }
 
 
+def _warm_container() -> None:
+    """
+    Build the router and run one throwaway validation during Lambda INIT.
+    
+    Provider clients and SDK imports are then set up before the first
+    invocation instead of stalling it. Failures are only logged: the
+    accessors are uncached on error, so the first request retries them.
+    """
+    try:
+        get_router()
+        validate_request(b'{"prompt": "warm-up"}')
+    except Exception as e:
+        logger.warning(f"Container warm-up failed, deferring to first request: {e}")
+
+
+if os.getenv('AWS_LAMBDA_FUNCTION_NAME'):
+    _warm_container()
+
+
 # For local development/testing
 if __name__ == "__main__":
     # Local development server using FastAPI
     import uvicorn
     from fastapi import FastAPI, Request, HTTPException, Security, APIRouter
+    from fastapi.concurrency import run_in_threadpool
     from fastapi.security import APIKeyHeader
     from fastapi.middleware.cors import CORSMiddleware
     
@@ -248,12 +423,13 @@ if __name__ == "__main__":
         class MockContext:
             aws_request_id = "local-dev"
         
-        # Process through Lambda handler
-        response = lambda_handler(event, MockContext())
+        # Process through Lambda handler on a worker thread, so a slow provider call
+        # does not block the event loop and concurrent requests are served in parallel
+        response = await run_in_threadpool(lambda_handler, event, MockContext())
         
         # Extract status and body
         status_code = response['statusCode']
-        response_body = json.loads(response['body'])
+        response_body = orjson.loads(response['body'])
         
         if status_code != 200:
             raise HTTPException(status_code=status_code, detail=response_body)
@@ -267,7 +443,7 @@ if __name__ == "__main__":
             "status": "healthy",
             "service": "omni-llm",
             "version": "1.0.0",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
     
     # Set development API key if not set
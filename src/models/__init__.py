@@ -7,21 +7,13 @@ Omni-LLM system, including request/response models, configuration schemas,
 and the complete architecture definition.
 """
 
+from typing import Any
+
+from . import architecture
 from .architecture import (
-    OmniLLMArchitecture,
-    OMNI_LLM_ARCHITECTURE,
     LLMProvider,
     ModelConfiguration,
-    VectorStoreType,
-    VectorStoreConfiguration,
-    EmbeddingProvider,
-    EmbeddingConfiguration,
-    MCPServerConfiguration,
-    SecurityConfiguration,
-    LambdaConfiguration,
-    RequestSchema,
-    ResponseSchema,
-    get_default_architecture
+    RequestSchema
 )
 
 __all__ = [
@@ -29,14 +21,14 @@ __all__ = [
     "OMNI_LLM_ARCHITECTURE",
     "LLMProvider",
     "ModelConfiguration",
-    "VectorStoreType", 
-    "VectorStoreConfiguration",
-    "EmbeddingProvider",
-    "EmbeddingConfiguration",
-    "MCPServerConfiguration",
-    "SecurityConfiguration",
-    "LambdaConfiguration",
     "RequestSchema",
     "ResponseSchema",
     "get_default_architecture"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    # The default architecture and its schemas are loaded on first access, not at import
+    if name in __all__:
+        return getattr(architecture, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
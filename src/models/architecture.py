@@ -6,13 +6,15 @@ This module defines the complete architecture schema for the Omni-LLM universal
 AI Lambda gateway using LangChain as the single provider with built-in fallback support.
 """
 
-from typing import Dict, List, Optional, Union, Any, Literal
-from enum import Enum
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Dict, List, Optional, Tuple, Any, Literal
+from enum import StrEnum
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # Core Architecture Components
-class ArchitectureLayer(str, Enum):
+class ArchitectureLayer(StrEnum):
     """Architecture layers in the Omni-LLM system."""
     API_GATEWAY = "api_gateway"
     LAMBDA_FUNCTION = "lambda_function"
@@ -24,7 +26,7 @@ class ArchitectureLayer(str, Enum):
 
 
 # LangChain Provider Configuration
-class LLMProvider(str, Enum):
+class LLMProvider(StrEnum):
     """Supported LLM providers through LangChain."""
     OPENAI = "openai"
     ANTHROPIC = "anthropic"
@@ -37,7 +39,7 @@ class LLMProvider(str, Enum):
     OLLAMA = "ollama"
 
 
-class ModelCapability(str, Enum):
+class ModelCapability(StrEnum):
     """Model capabilities through LangChain."""
     CHAT = "chat"
     EMBEDDINGS = "embeddings"
@@ -48,7 +50,7 @@ class ModelCapability(str, Enum):
     MCP_SUPPORT = "mcp_support"
 
 
-class FallbackStrategy(str, Enum):
+class FallbackStrategy(StrEnum):
     """LangChain native fallback strategies."""
     PRIORITY_ORDER = "priority_order"
     COST_OPTIMIZED = "cost_optimized"
@@ -57,27 +59,96 @@ class FallbackStrategy(str, Enum):
     BALANCED = "balanced"
 
 
-class ModelConfiguration(BaseModel):
-    """LangChain model configuration schema."""
-    name: str = Field(description="Model name as used in LangChain")
-    provider: LLMProvider = Field(description="Provider name")
-    capabilities: List[ModelCapability] = Field(description="Model capabilities")
-    context_length: int = Field(description="Maximum context length")
-    cost_per_1m_input_tokens: float = Field(description="Cost per 1M input tokens USD")
-    cost_per_1m_output_tokens: float = Field(description="Cost per 1M output tokens USD")
-    latency_category: Literal["ultra_fast", "fast", "medium", "slow"] = Field(description="Latency category")
-    priority: int = Field(default=1, description="Priority for fallback (1=highest)")
-    use_cases: List[str] = Field(description="Recommended use cases")
+# Plain string forms of the enums above, for request fields validated on every call.
+# pydantic-core checks a Literal against a set of strings without building enum members;
+# members still compare equal to these strings, so enum comparisons keep working.
+LLMProviderName = Literal[
+    "openai", "anthropic", "bedrock", "vertexai", "mistral", "cohere", "groq", "huggingface", "ollama"
+]
+FallbackStrategyName = Literal[
+    "priority_order", "cost_optimized", "performance_optimized", "quality_optimized", "balanced"
+]
+
+
+# List prices in USD per 1M (input, output) tokens, keyed by model name. The
+# catalog reports these to clients and the provider prices completed calls
+# with them, so this is the only place prices are kept
+MODEL_PRICING_PER_1M: Dict[str, Tuple[float, float]] = {
+    # OpenAI
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-3.5-turbo": (0.50, 1.50),
+    "o3-mini": (1.10, 4.40),
+    "gpt-4o-realtime": (5.00, 20.00),
+    # Anthropic
+    "claude-sonnet-4": (3.00, 15.00),
+    "claude-opus-4": (15.00, 75.00),
+    "claude-3-5-sonnet": (3.00, 15.00),
+    "claude-3-5-haiku": (0.80, 4.00),
+    "claude-3-5-sonnet-20241022": (3.00, 15.00),
+    "claude-3-5-haiku-20241022": (0.80, 4.00),
+    # Groq
+    "llama-3.3-70b-versatile": (0.59, 0.79),
+    "llama-3.3-70b-specdec": (0.59, 0.99),
+    "llama-3.1-70b-versatile": (0.59, 0.79),
+    "llama-3.1-8b-instant": (0.05, 0.08),
+    "mixtral-8x7b-32768": (0.24, 0.24),
+    # Mistral AI
+    "codestral-25.01": (0.30, 0.90),
+    "devstral": (0.10, 0.30),
+    "mistral-large-latest": (2.00, 6.00),
+    "mistral-small-latest": (0.10, 0.30),
+    # Cohere
+    "command-r-plus": (2.50, 10.00),
+    "command-r": (0.15, 0.60),
+    # AWS Bedrock
+    "anthropic.claude-3-5-sonnet-20241022-v2:0": (3.00, 15.00),
+    "anthropic.claude-3-5-haiku-20241022-v1:0": (0.80, 4.00),
+    # Google Vertex AI
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.0-flash": (0.10, 0.40),
+    "gemini-2.0-flash-lite": (0.075, 0.30),
+    "gemini-1.5-pro": (1.25, 5.00),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ModelConfiguration:
+    """
+    LangChain model configuration schema.
+    
+    Only ever built from the trusted catalog literals below, so it is a plain
+    dataclass and skips Pydantic validation and schema construction.
+    """
+    name: str  # Model name as used in LangChain
+    provider: LLMProvider  # Provider name
+    capabilities: Tuple[ModelCapability, ...]  # Model capabilities
+    context_length: int  # Maximum context length
+    cost_per_1m_input_tokens: float = field(init=False, default=0.0)  # Cost per 1M input tokens USD
+    cost_per_1m_output_tokens: float = field(init=False, default=0.0)  # Cost per 1M output tokens USD
+    latency_category: Literal["ultra_fast", "fast", "medium", "slow"]  # Latency category
+    use_cases: Tuple[str, ...]  # Recommended use cases
+    priority: int = 1  # Priority for fallback (1=highest)
+    
+    def __post_init__(self) -> None:
+        # Prices are looked up rather than passed in, so the catalog cannot drift from billing
+        input_price, output_price = MODEL_PRICING_PER_1M[self.name]
+        object.__setattr__(self, "cost_per_1m_input_tokens", input_price)
+        object.__setattr__(self, "cost_per_1m_output_tokens", output_price)
 
 
 # Request/Response Schema
 class RequestSchema(BaseModel):
     """Complete request schema for LangChain provider."""
+    
+    # Unknown client fields are still ignored, as before
+    model_config = ConfigDict(frozen=True)
+    
     prompt: str = Field(description="User prompt")
     
     # Model Selection
     model_name: Optional[str] = Field(default=None, description="Specific model name")
-    provider_preference: Optional[List[LLMProvider]] = Field(default=None, description="Preferred providers in order")
+    provider_preference: Optional[List[LLMProviderName]] = Field(default=None, description="Preferred providers in order")
     
     # LangChain Parameters
     temperature: float = Field(default=0.7, ge=0.0, le=2.0, description="Temperature")
@@ -91,8 +162,9 @@ class RequestSchema(BaseModel):
     
     # Fallback Configuration
     enable_fallback: bool = Field(default=True, description="Enable provider fallback")
-    fallback_strategy: FallbackStrategy = Field(default=FallbackStrategy.PRIORITY_ORDER, description="Fallback strategy")
+    fallback_strategy: FallbackStrategyName = Field(default="priority_order", description="Fallback strategy")
     max_fallback_attempts: int = Field(default=3, ge=1, le=10, description="Maximum fallback attempts")
+    hedge_enabled: bool = Field(default=False, description="Start the fallback chain early while a slow primary is still running")
     
     # RAG Configuration
     rag_enabled: bool = Field(default=False, description="Enable RAG")
@@ -115,253 +187,158 @@ class RequestSchema(BaseModel):
     cache_enabled: bool = Field(default=True, description="Enable response caching")
 
 
-class ProviderAttempt(BaseModel):
-    """Details of a provider attempt."""
-    provider: LLMProvider = Field(description="Provider attempted")
-    model: str = Field(description="Model attempted")
-    success: bool = Field(description="Whether attempt succeeded")
-    error: Optional[str] = Field(description="Error message if failed")
-    latency: float = Field(description="Response time in seconds")
-    cost: float = Field(description="Cost in USD")
-
-
-class ResponseSchema(BaseModel):
-    """Complete response schema."""
-    success: bool = Field(description="Request success status")
-    content: Optional[str] = Field(description="Generated content")
-    structured_data: Optional[Dict[str, Any]] = Field(description="Structured output data")
-    
-    # Provider Information
-    provider_used: LLMProvider = Field(description="Final provider used")
-    model_used: str = Field(description="Final model used")
-    fallback_attempts: List[ProviderAttempt] = Field(description="All provider attempts")
-    
-    # Usage Statistics
-    total_tokens: int = Field(description="Total tokens used")
-    prompt_tokens: int = Field(description="Prompt tokens")
-    completion_tokens: int = Field(description="Completion tokens")
-    total_cost: float = Field(description="Total cost in USD")
-    
-    # Performance Metrics
-    total_latency: float = Field(description="Total request time in seconds")
-    provider_latency: float = Field(description="Provider response time in seconds")
-    
-    # RAG Context
-    rag_context: Optional[List[Dict[str, Any]]] = Field(description="RAG retrieved documents")
-    
-    # MCP Tool Calls
-    tool_calls: Optional[List[Dict[str, Any]]] = Field(description="MCP tool executions")
-    
-    # Error Information
-    error: Optional[Dict[str, Any]] = Field(description="Error details if failed")
-    
-    # Metadata
-    request_id: str = Field(description="Request identifier")
-    timestamp: str = Field(description="Response timestamp")
-
-
-class LangChainConfiguration(BaseModel):
-    """LangChain provider configuration."""
-    
-    # Provider Configurations
-    openai_config: Dict[str, Any] = Field(default_factory=dict, description="OpenAI configuration")
-    anthropic_config: Dict[str, Any] = Field(default_factory=dict, description="Anthropic configuration")
-    bedrock_config: Dict[str, Any] = Field(default_factory=dict, description="AWS Bedrock configuration")
-    vertexai_config: Dict[str, Any] = Field(default_factory=dict, description="Google Vertex AI configuration")
-    mistral_config: Dict[str, Any] = Field(default_factory=dict, description="Mistral AI configuration")
-    cohere_config: Dict[str, Any] = Field(default_factory=dict, description="Cohere configuration")
-    groq_config: Dict[str, Any] = Field(default_factory=dict, description="Groq configuration")
+@dataclass(frozen=True, slots=True)
+class ProviderAttempt:
+    """
+    Details of a provider attempt.
     
-    # LangChain Fallback Configuration
-    default_fallback_strategy: FallbackStrategy = Field(default=FallbackStrategy.BALANCED)
+    Recorded internally for every chain member tried, so it is a plain
+    dataclass rather than a validated model.
+    """
+    provider: LLMProvider  # Provider attempted
+    model: str  # Model attempted
+    success: bool  # Whether attempt succeeded
+    error: Optional[str]  # Error message if failed
+    latency: float  # Response time in seconds
+    cost: Optional[float]  # Cost in USD, None if the model has no list price
     
-    # Performance Configuration
-    provider_timeout: int = Field(default=60, description="Individual provider timeout")
-    cache_ttl: int = Field(default=3600, description="Cache TTL in seconds")
-    
-    # Cost Management
-    cost_per_request_limit: float = Field(default=1.0, description="Max cost per request USD")
-    enable_cost_optimization: bool = Field(default=True, description="Enable cost-based routing")
+    def to_summary(self) -> Dict[str, Any]:
+        """Render the attempt as reported in response metadata."""
+        return {
+            "provider": self.provider.value,
+            "model": self.model,
+            "success": self.success,
+            "latency": self.latency,
+            "cost": self.cost,
+            "error": self.error
+        }
 
 
-# Complete System Architecture
-class OmniLLMArchitecture(BaseModel):
-    """Complete Omni-LLM system architecture definition using LangChain."""
-    
-    # System metadata
-    version: str = Field(default="2.0.0", description="Architecture version")
-    description: str = Field(
-        default="Universal AI Lambda Gateway with LangChain Provider",
-        description="System description"
-    )
-    
-    # Core configuration
-    langchain_config: LangChainConfiguration = Field(description="LangChain configuration")
-    
-    # Available models through LangChain
-    model_catalog: List[ModelConfiguration] = Field(description="Available models")
-    
-    # Request/Response schemas
-    request_schema: RequestSchema = Field(description="Request format")
-    response_schema: ResponseSchema = Field(description="Response format")
-    
-    # Performance targets
-    performance_targets: Dict[str, Union[int, float, str]] = Field(
-        default={
-            "cold_start_max_seconds": 5,
-            "warm_response_max_seconds": 1,
-            "fallback_max_seconds": 30,
-            "max_concurrent_requests": 1000,
-            "target_uptime_percentage": 99.9,
-            "cost_per_request_target": 0.01
-        },
-        description="Performance targets"
-    )
+# Capability sets shared by the catalog entries below
+_CAPS_VISION = (ModelCapability.CHAT, ModelCapability.FUNCTION_CALLING, ModelCapability.VISION, ModelCapability.STREAMING)
+_CAPS_TOOLS = (ModelCapability.CHAT, ModelCapability.FUNCTION_CALLING, ModelCapability.STREAMING)
+_CAPS_BASIC = (ModelCapability.CHAT, ModelCapability.STREAMING)
+_CAPS_RAG = (ModelCapability.CHAT, ModelCapability.FUNCTION_CALLING, ModelCapability.RAG_COMPATIBLE)
 
 
 # Predefined Model Catalog for LangChain
-def get_langchain_model_catalog() -> List[ModelConfiguration]:
-    """Get the default model catalog for LangChain providers."""
+@cache
+def get_langchain_model_catalog() -> Tuple[ModelConfiguration, ...]:
+    """
+    Get the default model catalog for LangChain providers.
     
-    return [
+    Built once and shared; the entries are frozen, so sharing is safe.
+    """
+    
+    return (
         # OpenAI Models
         ModelConfiguration(
             name="gpt-4o",
             provider=LLMProvider.OPENAI,
-            capabilities=[ModelCapability.CHAT, ModelCapability.FUNCTION_CALLING, ModelCapability.VISION, ModelCapability.STREAMING],
+            capabilities=_CAPS_VISION,
             context_length=128000,
-            cost_per_1m_input_tokens=5.0,
-            cost_per_1m_output_tokens=15.0,
             latency_category="fast",
             priority=1,
-            use_cases=["general purpose", "vision", "function calling"]
+            use_cases=("general purpose", "vision", "function calling")
         ),
         ModelConfiguration(
             name="gpt-4o-mini",
             provider=LLMProvider.OPENAI,
-            capabilities=[ModelCapability.CHAT, ModelCapability.FUNCTION_CALLING, ModelCapability.STREAMING],
+            capabilities=_CAPS_TOOLS,
             context_length=128000,
-            cost_per_1m_input_tokens=0.15,
-            cost_per_1m_output_tokens=0.6,
             latency_category="fast",
             priority=2,
-            use_cases=["cost-effective", "high volume", "simple tasks"]
+            use_cases=("cost-effective", "high volume", "simple tasks")
         ),
         ModelConfiguration(
             name="gpt-3.5-turbo",
             provider=LLMProvider.OPENAI,
-            capabilities=[ModelCapability.CHAT, ModelCapability.FUNCTION_CALLING, ModelCapability.STREAMING],
+            capabilities=_CAPS_TOOLS,
             context_length=16384,
-            cost_per_1m_input_tokens=1.5,
-            cost_per_1m_output_tokens=2.0,
             latency_category="fast",
             priority=3,
-            use_cases=["budget-friendly", "simple conversations"]
+            use_cases=("budget-friendly", "simple conversations")
         ),
         
         # Anthropic Models
         ModelConfiguration(
             name="claude-3-5-sonnet-20241022",
             provider=LLMProvider.ANTHROPIC,
-            capabilities=[ModelCapability.CHAT, ModelCapability.FUNCTION_CALLING, ModelCapability.VISION, ModelCapability.STREAMING],
+            capabilities=_CAPS_VISION,
             context_length=200000,
-            cost_per_1m_input_tokens=15.0,
-            cost_per_1m_output_tokens=75.0,
             latency_category="medium",
             priority=1,
-            use_cases=["reasoning", "analysis", "long context"]
+            use_cases=("reasoning", "analysis", "long context")
         ),
         ModelConfiguration(
             name="claude-3-5-haiku-20241022",
             provider=LLMProvider.ANTHROPIC,
-            capabilities=[ModelCapability.CHAT, ModelCapability.FUNCTION_CALLING, ModelCapability.STREAMING],
+            capabilities=_CAPS_TOOLS,
             context_length=200000,
-            cost_per_1m_input_tokens=1.0,
-            cost_per_1m_output_tokens=5.0,
             latency_category="fast",
             priority=2,
-            use_cases=["fast responses", "cost-effective"]
+            use_cases=("fast responses", "cost-effective")
         ),
         
         # Groq Models (Ultra-fast)
         ModelConfiguration(
             name="llama-3.1-70b-versatile",
             provider=LLMProvider.GROQ,
-            capabilities=[ModelCapability.CHAT, ModelCapability.FUNCTION_CALLING, ModelCapability.STREAMING],
+            capabilities=_CAPS_TOOLS,
             context_length=32768,
-            cost_per_1m_input_tokens=0.59,
-            cost_per_1m_output_tokens=0.79,
             latency_category="ultra_fast",
             priority=1,
-            use_cases=["real-time", "low latency", "cost-effective"]
+            use_cases=("real-time", "low latency", "cost-effective")
         ),
         ModelConfiguration(
             name="llama-3.1-8b-instant",
             provider=LLMProvider.GROQ,
-            capabilities=[ModelCapability.CHAT, ModelCapability.STREAMING],
+            capabilities=_CAPS_BASIC,
             context_length=32768,
-            cost_per_1m_input_tokens=0.05,
-            cost_per_1m_output_tokens=0.08,
             latency_category="ultra_fast",
             priority=2,
-            use_cases=["ultra-fast", "ultra-cheap", "simple tasks"]
+            use_cases=("ultra-fast", "ultra-cheap", "simple tasks")
         ),
         
         # Mistral Models
         ModelConfiguration(
             name="mistral-large-latest",
             provider=LLMProvider.MISTRAL_AI,
-            capabilities=[ModelCapability.CHAT, ModelCapability.FUNCTION_CALLING, ModelCapability.STREAMING],
+            capabilities=_CAPS_TOOLS,
             context_length=32768,
-            cost_per_1m_input_tokens=4.0,
-            cost_per_1m_output_tokens=12.0,
             latency_category="medium",
             priority=1,
-            use_cases=["multilingual", "reasoning"]
+            use_cases=("multilingual", "reasoning")
         ),
         
         # Cohere Models
         ModelConfiguration(
             name="command-r-plus",
             provider=LLMProvider.COHERE,
-            capabilities=[ModelCapability.CHAT, ModelCapability.FUNCTION_CALLING, ModelCapability.RAG_COMPATIBLE],
+            capabilities=_CAPS_RAG,
             context_length=128000,
-            cost_per_1m_input_tokens=3.0,
-            cost_per_1m_output_tokens=15.0,
             latency_category="medium",
             priority=1,
-            use_cases=["RAG", "enterprise", "search"]
+            use_cases=("RAG", "enterprise", "search")
         )
-    ]
+    )
 
 
-def get_default_architecture() -> OmniLLMArchitecture:
-    """Get the default Omni-LLM architecture configuration."""
-    
-    return OmniLLMArchitecture(
-        langchain_config=LangChainConfiguration(),
-        model_catalog=get_langchain_model_catalog(),
-        request_schema=RequestSchema(
-            prompt="Example prompt",
-            model_name="gpt-4o-mini"
-        ),
-        response_schema=ResponseSchema(
-            success=True,
-            content="Example response",
-            provider_used=LLMProvider.OPENAI,
-            model_used="gpt-4o-mini",
-            fallback_attempts=[],
-            total_tokens=100,
-            prompt_tokens=50,
-            completion_tokens=50,
-            total_cost=0.01,
-            total_latency=1.5,
-            provider_latency=1.2,
-            request_id="example-123",
-            timestamp="2024-01-01T00:00:00Z"
-        )
-    )
+# Names served from the defaults module, which is only imported on first access
+_DEFAULTS_EXPORTS = frozenset({
+    "ResponseSchema",
+    "LangChainConfiguration",
+    "OmniLLMArchitecture",
+    "get_default_architecture"
+})
 
 
-# Export the complete architecture
-OMNI_LLM_ARCHITECTURE = get_default_architecture()
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    # Export the complete architecture, built on first access rather than at import
+    if name == "OMNI_LLM_ARCHITECTURE":
+        from .defaults import get_default_architecture
+        return get_default_architecture()
+    if name in _DEFAULTS_EXPORTS:
+        from . import defaults
+        return getattr(defaults, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
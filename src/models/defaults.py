@@ -0,0 +1,159 @@
+"""
+Omni-LLM Default Architecture
+=============================
+
+The complete system architecture definition and its default instance. These
+schemas are only needed to describe the system, not to serve requests, so
+they live apart from the request schemas and are imported on first use.
+"""
+
+from functools import cache
+from types import MappingProxyType
+from typing import Dict, Final, List, Mapping, Optional, Tuple, Union, Any
+from pydantic import BaseModel, ConfigDict, Field
+
+from .architecture import (
+    FallbackStrategy,
+    LLMProvider,
+    ModelConfiguration,
+    ProviderAttempt,
+    RequestSchema,
+    get_langchain_model_catalog
+)
+
+# Performance targets of the system; each architecture gets a shallow dict copy instead of a deepcopy
+PERFORMANCE_TARGETS: Final[Mapping[str, Union[int, float, str]]] = MappingProxyType({
+    "cold_start_max_seconds": 5,
+    "warm_response_max_seconds": 1,
+    "fallback_max_seconds": 30,
+    "max_concurrent_requests": 1000,
+    "target_uptime_percentage": 99.9,
+    "cost_per_request_target": 0.01
+})
+
+
+class ResponseSchema(BaseModel):
+    """Complete response schema."""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    success: bool = Field(description="Request success status")
+    content: Optional[str] = Field(default=None, description="Generated content")
+    structured_data: Optional[Dict[str, Any]] = Field(default=None, description="Structured output data")
+    
+    # Provider Information
+    provider_used: LLMProvider = Field(description="Final provider used")
+    model_used: str = Field(description="Final model used")
+    fallback_attempts: List[ProviderAttempt] = Field(description="All provider attempts")
+    
+    # Usage Statistics
+    total_tokens: int = Field(description="Total tokens used")
+    prompt_tokens: int = Field(description="Prompt tokens")
+    completion_tokens: int = Field(description="Completion tokens")
+    total_cost: Optional[float] = Field(description="Total cost in USD, None if unknown")
+    
+    # Performance Metrics
+    total_latency: float = Field(description="Total request time in seconds")
+    provider_latency: float = Field(description="Provider response time in seconds")
+    
+    # RAG Context
+    rag_context: Optional[List[Dict[str, Any]]] = Field(default=None, description="RAG retrieved documents")
+    
+    # MCP Tool Calls
+    tool_calls: Optional[List[Dict[str, Any]]] = Field(default=None, description="MCP tool executions")
+    
+    # Error Information
+    error: Optional[Dict[str, Any]] = Field(default=None, description="Error details if failed")
+    
+    # Metadata
+    request_id: str = Field(description="Request identifier")
+    timestamp: str = Field(description="Response timestamp")
+
+
+class LangChainConfiguration(BaseModel):
+    """LangChain provider configuration."""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    # Provider Configurations
+    openai_config: Dict[str, Any] = Field(default_factory=dict, description="OpenAI configuration")
+    anthropic_config: Dict[str, Any] = Field(default_factory=dict, description="Anthropic configuration")
+    bedrock_config: Dict[str, Any] = Field(default_factory=dict, description="AWS Bedrock configuration")
+    vertexai_config: Dict[str, Any] = Field(default_factory=dict, description="Google Vertex AI configuration")
+    mistral_config: Dict[str, Any] = Field(default_factory=dict, description="Mistral AI configuration")
+    cohere_config: Dict[str, Any] = Field(default_factory=dict, description="Cohere configuration")
+    groq_config: Dict[str, Any] = Field(default_factory=dict, description="Groq configuration")
+    
+    # LangChain Fallback Configuration
+    default_fallback_strategy: FallbackStrategy = Field(default=FallbackStrategy.BALANCED)
+    
+    # Performance Configuration
+    provider_timeout: int = Field(default=60, description="Individual provider timeout")
+    cache_ttl: int = Field(default=3600, description="Cache TTL in seconds")
+    
+    # Cost Management
+    cost_per_request_limit: float = Field(default=1.0, description="Max cost per request USD")
+    enable_cost_optimization: bool = Field(default=True, description="Enable cost-based routing")
+
+
+# Complete System Architecture
+class OmniLLMArchitecture(BaseModel):
+    """Complete Omni-LLM system architecture definition using LangChain."""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    # System metadata
+    version: str = Field(default="2.0.0", description="Architecture version")
+    description: str = Field(
+        default="Universal AI Lambda Gateway with LangChain Provider",
+        description="System description"
+    )
+    
+    # Core configuration
+    langchain_config: LangChainConfiguration = Field(description="LangChain configuration")
+    
+    # Available models through LangChain
+    model_catalog: Tuple[ModelConfiguration, ...] = Field(description="Available models")
+    
+    # Request/Response schemas
+    request_schema: RequestSchema = Field(description="Request format")
+    response_schema: ResponseSchema = Field(description="Response format")
+    
+    # Performance targets
+    performance_targets: Dict[str, Union[int, float, str]] = Field(
+        default_factory=lambda: dict(PERFORMANCE_TARGETS),
+        description="Performance targets"
+    )
+
+
+@cache
+def get_default_architecture() -> OmniLLMArchitecture:
+    """
+    Get the default Omni-LLM architecture configuration.
+    
+    Built on first use and shared afterwards; callers must not mutate it.
+    """
+    
+    return OmniLLMArchitecture(
+        langchain_config=LangChainConfiguration(),
+        model_catalog=get_langchain_model_catalog(),
+        request_schema=RequestSchema(
+            prompt="Example prompt",
+            model_name="gpt-4o-mini"
+        ),
+        response_schema=ResponseSchema(
+            success=True,
+            content="Example response",
+            provider_used=LLMProvider.OPENAI,
+            model_used="gpt-4o-mini",
+            fallback_attempts=[],
+            total_tokens=100,
+            prompt_tokens=50,
+            completion_tokens=50,
+            total_cost=0.01,
+            total_latency=1.5,
+            provider_latency=1.2,
+            request_id="example-123",
+            timestamp="2024-01-01T00:00:00Z"
+        )
+    )
@@ -3,10 +3,20 @@ Omni-LLM Providers
 ==================
 
 LangChain-based universal provider with built-in fallback support.
+
+LangChainProvider is loaded on first access, so importing this package does
+not pull in LangChain and the provider SDKs.
 """
 
-from .langchain_provider import LangChainProvider
+from typing import Any
 
 __all__ = [
     "LangChainProvider"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "LangChainProvider":
+        from .langchain_provider import LangChainProvider
+        return LangChainProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
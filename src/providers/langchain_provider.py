@@ -7,16 +7,24 @@ automatic provider fallback support.
 """
 
 import logging
+import os
+import threading
 import time
-from typing import Dict, Any, List, Optional, Union
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Tuple, Type
+from datetime import datetime, timezone
+from uuid import UUID
+
+import orjson
 
 # LangChain core imports
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.runnables import Runnable, RunnableWithFallbacks
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
 from langchain_core.exceptions import LangChainException
 
 # Provider-specific imports
@@ -37,12 +45,485 @@ try:
 except ImportError:
     ChatVertexAI = None
 
-from ..core.exceptions import ProviderError, ConfigurationError
-from ..models.architecture import RequestSchema, LLMProvider, FallbackStrategy
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+from ..core.exceptions import ProviderError, ConfigurationError, HTTP_STATUS_ERRORS
+from ..models.architecture import (
+    RequestSchema,
+    LLMProvider,
+    FallbackStrategy,
+    ProviderAttempt,
+    MODEL_PRICING_PER_1M
+)
 from ..utils.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Provider behind each LangChain chat model class
+MODEL_CLASS_PROVIDERS: Dict[type, LLMProvider] = {
+    ChatOpenAI: LLMProvider.OPENAI,
+    ChatAnthropic: LLMProvider.ANTHROPIC,
+    ChatMistralAI: LLMProvider.MISTRAL_AI,
+    ChatCohere: LLMProvider.COHERE,
+    ChatGroq: LLMProvider.GROQ,
+}
+if ChatBedrock:
+    MODEL_CLASS_PROVIDERS[ChatBedrock] = LLMProvider.AWS_BEDROCK
+if ChatVertexAI:
+    MODEL_CLASS_PROVIDERS[ChatVertexAI] = LLMProvider.GOOGLE_VERTEX_AI
+
+# Connection-class errors that indicate the whole provider is unreachable.
+# Read timeouts are excluded: a slow completion says nothing about the
+# provider's other models, so it must not open the provider's circuit.
+PROVIDER_OUTAGE_ERRORS: Tuple[Type[BaseException], ...] = (ConnectionError,)
+
+# SDK timeout errors, which cover both connect and read timeouts
+SDK_TIMEOUT_ERRORS: Tuple[Type[BaseException], ...] = ()
+
+if HTTPX_AVAILABLE:
+    PROVIDER_OUTAGE_ERRORS += (httpx.ConnectError, httpx.ConnectTimeout)
+
+try:
+    from openai import APIConnectionError as OpenAIConnectionError, APITimeoutError as OpenAITimeoutError
+    PROVIDER_OUTAGE_ERRORS += (OpenAIConnectionError,)
+    SDK_TIMEOUT_ERRORS += (OpenAITimeoutError,)
+except ImportError:
+    pass
+
+try:
+    from anthropic import APIConnectionError as AnthropicConnectionError, APITimeoutError as AnthropicTimeoutError
+    PROVIDER_OUTAGE_ERRORS += (AnthropicConnectionError,)
+    SDK_TIMEOUT_ERRORS += (AnthropicTimeoutError,)
+except ImportError:
+    pass
+
+# Run metadata key used to tag each chain member with its model name
+MODEL_METADATA_KEY = "omni_llm_model"
+
+# Prices of (cache read, cache write) input tokens relative to the base input price
+CACHED_INPUT_PRICE_MULTIPLIERS: Dict[LLMProvider, Tuple[float, float]] = {
+    LLMProvider.ANTHROPIC: (0.1, 1.25),
+    LLMProvider.AWS_BEDROCK: (0.1, 1.25),
+    LLMProvider.OPENAI: (0.5, 1.0),
+}
+
+# Token counts of a typical call, used to turn per-1M prices into per-call costs
+TYPICAL_CALL_TOKENS = (1000, 500)
+
+# Floor for per-call costs so free/unknown models don't divide by zero
+MIN_COST_PER_CALL_USD = 1e-6
+
+# Number of requests between re-sorts of the stats-ordered chains
+CHAIN_REORDER_INTERVAL = 100
+
+# Smoothing factor for the per-model latency EWMA
+LATENCY_EWMA_ALPHA = 0.2
+
+# Successful calls needed before a model's latency estimate replaces the static hedge delay
+MIN_LATENCY_SAMPLES = 5
+
+# Successful calls with reported output tokens needed before a model's
+# generation speed replaces its static read timeout
+MIN_TOKEN_RATE_SAMPLES = 20
+
+# Multiplier applied to the estimated p99 generation time to get a read timeout
+TIMEOUT_HEADROOM = 2.0
+
+# Chat models whose SDKs accept a per-request timeout override
+PER_CALL_TIMEOUT_MODEL_CLASSES: Tuple[type, ...] = (ChatOpenAI, ChatAnthropic, ChatGroq)
+
+# Token counts reported for a request; the cache counts are included in prompt_tokens
+TOKEN_USAGE_KEYS = (
+    "prompt_tokens", "completion_tokens", "total_tokens",
+    "cache_read_input_tokens", "cache_creation_input_tokens"
+)
+
+# Maximum number of chains kept pre-bound to a set of sampling parameters
+BOUND_CHAIN_CACHE_SIZE = 256
+
+# System prompts shorter than this (~1024 tokens, Anthropic's minimum cacheable prefix) are not marked for caching
+ANTHROPIC_CACHE_MIN_SYSTEM_CHARS = 4096
+
+
+def _mark_system_prompt_cacheable(messages: List) -> List:
+    """
+    Mark a long leading system prompt as an Anthropic prompt cache breakpoint.
+    
+    Requests that share the system prompt then read it from Anthropic's
+    prompt cache, which bills those input tokens at a fraction of the
+    normal rate and shortens time to first token.
+    
+    Args:
+        messages: Messages about to be sent to an Anthropic model
+    
+    Returns:
+        The messages, with the system prompt as a cache_control content block
+        if it is long enough to be cached
+    """
+    if not messages or not isinstance(messages[0], SystemMessage):
+        return messages
+    
+    system_prompt = messages[0].content
+    if not isinstance(system_prompt, str) or len(system_prompt) < ANTHROPIC_CACHE_MIN_SYSTEM_CHARS:
+        return messages
+    
+    cached_system = SystemMessage(content=[
+        {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+    ])
+    return [cached_system, *messages[1:]]
+
+
+def _is_provider_outage(error: Optional[BaseException]) -> bool:
+    """
+    Whether an attempt error means the provider itself is unreachable.
+    
+    The OpenAI and Anthropic SDKs raise the same timeout error for connect
+    and read timeouts, so those only count when caused by a connect timeout.
+    """
+    if isinstance(error, SDK_TIMEOUT_ERRORS):
+        return HTTPX_AVAILABLE and isinstance(error.__cause__, httpx.ConnectTimeout)
+    return isinstance(error, PROVIDER_OUTAGE_ERRORS)
+
+
+def _canonicalize_prompt(text: str) -> str:
+    """
+    Normalize line endings and strip trailing whitespace from a prompt.
+    
+    Provider prefix caches only match byte-identical prefixes, so a system
+    prompt that arrives with CRLF line endings from one client would
+    otherwise miss the cache entry written by another. Whitespace inside the
+    prompt is left alone, since it can be meaningful (Markdown line breaks,
+    code, diffs).
+    """
+    return text.replace("\r\n", "\n").replace("\r", "\n").rstrip()
+
+
+def _token_usage(message: Any) -> Dict[str, int]:
+    """
+    Extract token counts from a chat model response message.
+    
+    Prefers LangChain's provider-neutral usage_metadata and falls back to the
+    raw OpenAI-style token_usage or Anthropic-style usage in response_metadata.
+    
+    Args:
+        message: AIMessage returned by a chat model, or None
+    
+    Returns:
+        Token counts keyed by TOKEN_USAGE_KEYS, zero where not reported
+    """
+    usage_metadata = getattr(message, "usage_metadata", None)
+    response_metadata = getattr(message, "response_metadata", None) or {}
+    
+    if usage_metadata:
+        details = usage_metadata.get("input_token_details") or {}
+        prompt_tokens = usage_metadata.get("input_tokens") or 0
+        completion_tokens = usage_metadata.get("output_tokens") or 0
+        cache_read = details.get("cache_read") or 0
+        cache_creation = details.get("cache_creation") or 0
+    elif response_metadata.get("token_usage"):
+        token_usage = response_metadata["token_usage"]
+        prompt_tokens = token_usage.get("prompt_tokens") or 0
+        completion_tokens = token_usage.get("completion_tokens") or 0
+        cache_read = (token_usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
+        cache_creation = 0
+    else:
+        # Anthropic reports cache reads and writes separately from input_tokens
+        usage = response_metadata.get("usage") or {}
+        cache_read = usage.get("cache_read_input_tokens") or 0
+        cache_creation = usage.get("cache_creation_input_tokens") or 0
+        prompt_tokens = (usage.get("input_tokens") or 0) + cache_read + cache_creation
+        completion_tokens = usage.get("output_tokens") or 0
+    
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "cache_read_input_tokens": cache_read,
+        "cache_creation_input_tokens": cache_creation
+    }
+
+
+class LazyModelRegistry(Mapping[str, BaseChatModel]):
+    """
+    Chat models by name, each constructed on first access.
+    
+    Building a model creates its SDK client, so constructing every configured
+    model up front adds to cold start time and memory for models a container
+    may never call. The registry holds each model's class and constructor
+    arguments and only builds the model when it is first looked up.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._specs: Dict[str, Tuple[Type[BaseChatModel], Dict[str, Any]]] = {}
+        self._models: Dict[str, BaseChatModel] = {}
+        self._lock = threading.Lock()
+    
+    def register(self, specs: Dict[str, Tuple[Type[BaseChatModel], Dict[str, Any]]]) -> None:
+        """
+        Register models without constructing them.
+        
+        Args:
+            specs: (model class, constructor kwargs) by model name
+        """
+        self._specs.update(specs)
+    
+    def model_class(self, name: str) -> Type[BaseChatModel]:
+        """Get a model's class without constructing it."""
+        return self._specs[name][0]
+    
+    def model_settings(self, name: str) -> Dict[str, Any]:
+        """Get the keyword arguments a model is constructed with, without constructing it."""
+        return self._specs[name][1]
+    
+    @property
+    def initialized(self) -> List[str]:
+        """Names of the models constructed so far."""
+        return list(self._models)
+    
+    def __getitem__(self, name: str) -> BaseChatModel:
+        model = self._models.get(name)
+        if model is not None:
+            return model
+        
+        model_class, kwargs = self._specs[name]
+        with self._lock:
+            if name not in self._models:
+                self._models[name] = model_class(**kwargs)
+                logger.debug(f"Initialized model {name}")
+            return self._models[name]
+    
+    def __contains__(self, name: object) -> bool:
+        # Mapping's default would construct the model via __getitem__
+        return name in self._specs
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+    
+    def __len__(self) -> int:
+        return len(self._specs)
+
+
+class ModelStats:
+    """
+    Running success and latency statistics and per-call cost for a single model.
+    
+    Used to order cascades by cost-normalized success probability (p/c),
+    which minimizes expected cost per successful request, to time hedged
+    requests from observed latency, and to size read timeouts from observed
+    generation speed.
+    """
+    
+    def __init__(self, cost_per_call_usd: float):
+        """
+        Initialize model statistics.
+        
+        Args:
+            cost_per_call_usd: Prior cost of a typical call in USD
+        """
+        self.cost_per_call_usd = cost_per_call_usd
+        self.attempts = 0
+        self.successes = 0
+        self.latency_ewma = 0.0
+        self.latency_deviation = 0.0
+        self.token_rate_samples = 0
+        self.seconds_per_token_ewma = 0.0
+        self.seconds_per_token_deviation = 0.0
+    
+    @property
+    def success_rate(self) -> float:
+        """Laplace-smoothed success rate, so unseen models are not starved."""
+        return (self.successes + 1) / (self.attempts + 2)
+    
+    @property
+    def score(self) -> float:
+        """Cost-normalized success probability (higher is better)."""
+        return self.success_rate / max(self.cost_per_call_usd, MIN_COST_PER_CALL_USD)
+    
+    @property
+    def latency_p95(self) -> float:
+        """Rough p95 latency in seconds, as EWMA plus two mean deviations."""
+        return self.latency_ewma + 2 * self.latency_deviation
+    
+    @property
+    def seconds_per_token_p99(self) -> float:
+        """Rough p99 seconds per output token, as EWMA plus four mean deviations."""
+        return self.seconds_per_token_ewma + 4 * self.seconds_per_token_deviation
+    
+    def record(self, success: bool, latency: float, completion_tokens: int = 0) -> None:
+        """
+        Record the outcome of a single attempt.
+        
+        Only successful calls update the latency estimates, since failures
+        are often timeouts or instant rejections and say little about how
+        long a real completion takes. Generation speed is only sampled from
+        calls that reported their output token count.
+        
+        Args:
+            success: Whether the attempt succeeded
+            latency: Attempt latency in seconds
+            completion_tokens: Output tokens the attempt generated
+        """
+        self.attempts += 1
+        if not success:
+            return
+        
+        self.successes += 1
+        if self.successes == 1:
+            self.latency_ewma = latency
+            self.latency_deviation = latency / 2
+        else:
+            # Same update as TCP's smoothed RTT estimator (RFC 6298)
+            self.latency_deviation += LATENCY_EWMA_ALPHA * (abs(latency - self.latency_ewma) - self.latency_deviation)
+            self.latency_ewma += LATENCY_EWMA_ALPHA * (latency - self.latency_ewma)
+        
+        if completion_tokens <= 0:
+            return
+        
+        # Includes time to first token, so short answers overstate the rate
+        # and only ever lengthen the timeouts sized from it
+        seconds_per_token = latency / completion_tokens
+        self.token_rate_samples += 1
+        if self.token_rate_samples == 1:
+            self.seconds_per_token_ewma = seconds_per_token
+            self.seconds_per_token_deviation = seconds_per_token / 2
+        else:
+            self.seconds_per_token_deviation += LATENCY_EWMA_ALPHA * (
+                abs(seconds_per_token - self.seconds_per_token_ewma) - self.seconds_per_token_deviation
+            )
+            self.seconds_per_token_ewma += LATENCY_EWMA_ALPHA * (seconds_per_token - self.seconds_per_token_ewma)
+
+
+class FallbackAttemptRecorder(BaseCallbackHandler):
+    """
+    Callback handler that records each model attempt made by a fallback chain.
+    
+    with_fallbacks() does not report which chain members it tried, so every
+    member is tagged with its model name in run metadata and this handler
+    turns chat model callbacks into ProviderAttempt records. Members whose
+    provider circuit is open are failed before any network call is made,
+    which makes the chain move straight on to the next candidate.
+    """
+    
+    # Propagate circuit-open errors so the skipped member's run is aborted.
+    # This applies to every callback, so the bookkeeping in on_llm_end and
+    # on_llm_error catches its own errors rather than failing a finished call.
+    raise_error = True
+    
+    def __init__(self, provider: "LangChainProvider"):
+        """
+        Initialize the recorder.
+        
+        Args:
+            provider: Provider owning the model statistics and circuits
+        """
+        self.provider = provider
+        self.attempts: List[ProviderAttempt] = []
+        self.usage: Dict[str, Dict[str, int]] = {}
+        self._runs: Dict[UUID, Tuple[str, float]] = {}
+    
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[Any]],
+        *,
+        run_id: UUID,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any
+    ) -> None:
+        """Start timing an attempt, or skip it if its provider circuit is open."""
+        model_name = (metadata or {}).get(MODEL_METADATA_KEY)
+        if model_name is None:
+            return
+        
+        provider = self.provider.model_providers[model_name]
+        if self.provider.is_circuit_open(provider):
+            self.attempts.append(ProviderAttempt(
+                provider=provider,
+                model=model_name,
+                success=False,
+                error="provider_circuit_open",
+                latency=0.0,
+                cost=0.0
+            ))
+            raise ProviderError(
+                f"Circuit open for provider {provider.value}",
+                provider=provider.value,
+                model=model_name,
+                status_code=503
+            )
+        
+        self._runs[run_id] = (model_name, time.perf_counter())
+    
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Record a successful attempt and the token usage it reported."""
+        try:
+            run = self._runs.get(run_id)
+            if run is not None and response.generations and response.generations[0]:
+                self.usage[run[0]] = _token_usage(getattr(response.generations[0][0], "message", None))
+            self._finish(run_id, None)
+        except Exception as e:
+            logger.warning(f"Failed to record successful attempt for run {run_id}: {e}")
+    
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """Record a failed attempt."""
+        try:
+            self._finish(run_id, error)
+        except Exception as e:
+            logger.warning(f"Failed to record failed attempt for run {run_id}: {e}")
+    
+    def merge(self, branch: "FallbackAttemptRecorder") -> None:
+        """
+        Add the attempts and token usage of a hedged branch to this recorder.
+        
+        Attempts the branch still has in flight are recorded as abandoned,
+        since the request no longer waits for them. Their cost is unknown:
+        the provider may still complete and bill the call.
+        
+        Args:
+            branch: Recorder of one branch of a hedged request
+        """
+        self.attempts.extend(branch.attempts)
+        now = time.perf_counter()
+        for model_name, start_time in list(branch._runs.values()):
+            self.attempts.append(ProviderAttempt(
+                provider=self.provider.model_providers[model_name],
+                model=model_name,
+                success=False,
+                error="abandoned_by_hedge",
+                latency=now - start_time,
+                cost=None
+            ))
+        self.usage.update(branch.usage)
+    
+    def _finish(self, run_id: UUID, error: Optional[BaseException]) -> None:
+        """Close out a timed attempt and report it to the provider."""
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        
+        model_name, start_time = run
+        latency = time.perf_counter() - start_time
+        usage = self.usage.get(model_name) or dict.fromkeys(TOKEN_USAGE_KEYS, 0)
+        if error is None:
+            cost = self.provider.calculate_cost(model_name, usage)
+        else:
+            cost = 0.0
+        self.attempts.append(ProviderAttempt(
+            provider=self.provider.model_providers[model_name],
+            model=model_name,
+            success=error is None,
+            error=str(error) if error is not None else None,
+            latency=latency,
+            cost=cost
+        ))
+        completion_tokens = usage["completion_tokens"] if error is None else 0
+        self.provider.record_attempt(model_name, error, latency, completion_tokens)
+
 
 class LangChainProvider:
     """
@@ -52,6 +533,9 @@ class LangChainProvider:
     to create robust runnable chains with automatic provider fallback.
     """
     
+    # Stateless, so a single parser is shared by all structured-output chains
+    _json_parser = JsonOutputParser()
+    
     def __init__(self, config: Config):
         """
         Initialize LangChain provider with fallback runnables.
@@ -60,267 +544,488 @@ class LangChainProvider:
             config: Configuration object
         """
         self.config = config
-        self.models: Dict[str, BaseChatModel] = {}
-        self.fallback_chains: Dict[str, RunnableWithFallbacks] = {}
+        self.models = LazyModelRegistry()
+        self.model_stats: Dict[str, ModelStats] = {}
+        self.model_providers: Dict[str, LLMProvider] = {}
+        self.fallback_chains: Dict[str, Runnable] = {}
+        self.chain_orders: Dict[str, List[str]] = {}
+        self._chain_cache: Dict[Tuple[str, ...], Runnable] = {}
+        self._specific_fallbacks: Dict[Tuple[str, str], List[str]] = {}
+        self._bound_chains: "OrderedDict[Tuple[Any, ...], Runnable]" = OrderedDict()
+        self._bound_chains_lock = threading.Lock()
+        self._provider_outage: Dict[LLMProvider, float] = {}
+        self._active_head: Dict[str, str] = {}
+        self._head_probed_at: Dict[str, float] = {}
+        self._requests_since_reorder = 0
+        self._hedge_executor = ThreadPoolExecutor(
+            max_workers=config.connection_pool_size,
+            thread_name_prefix="omni-llm-hedge"
+        )
+        self._http_client = self._build_http_client()
         self._initialize_models()
+        self._initialize_model_metadata()
         self._create_fallback_chains()
     
     def _initialize_models(self) -> None:
-        """Initialize all available LangChain models."""
+        """Register all available LangChain models; each is built on first use."""
         try:
             # OpenAI models (Latest 2025)
             if self.config.openai_api_key:
-                self.models.update({
-                    "gpt-4o": ChatOpenAI(
+                self.models.register({
+                    "gpt-4o": (ChatOpenAI, dict(
                         model="gpt-4o-2024-11-20",  # Latest stable with 16K output
                         api_key=self.config.openai_api_key,
+                        http_client=self._http_client,
                         max_retries=0,  # Let fallback handle retries
-                        timeout=60
-                    ),
-                    "gpt-4o-mini": ChatOpenAI(
+                        timeout=self._client_timeout(60)
+                    )),
+                    "gpt-4o-mini": (ChatOpenAI, dict(
                         model="gpt-4o-mini-2024-12-17",  # Real-time audio capabilities
                         api_key=self.config.openai_api_key,
+                        http_client=self._http_client,
                         max_retries=0,
-                        timeout=60
-                    ),
-                    "o3-mini": ChatOpenAI(
+                        timeout=self._client_timeout(60)
+                    )),
+                    "o3-mini": (ChatOpenAI, dict(
                         model="o3-mini-2025-01-31",  # New reasoning model
                         api_key=self.config.openai_api_key,
+                        http_client=self._http_client,
                         max_retries=0,
-                        timeout=90  # Reasoning models may need more time
-                    ),
-                    "gpt-4o-realtime": ChatOpenAI(
+                        timeout=self._client_timeout(90)  # Reasoning models may need more time
+                    )),
+                    "gpt-4o-realtime": (ChatOpenAI, dict(
                         model="gpt-4o-realtime-preview-2024-12-17",  # Real-time audio
                         api_key=self.config.openai_api_key,
+                        http_client=self._http_client,
                         max_retries=0,
-                        timeout=60
-                    )
+                        timeout=self._client_timeout(60)
+                    ))
                 })
-                logger.info("OpenAI models initialized")
+                logger.info("OpenAI models registered")
             
             # Anthropic models (Latest 2025)
             if self.config.anthropic_api_key:
-                self.models.update({
-                    "claude-sonnet-4": ChatAnthropic(
+                self.models.register({
+                    "claude-sonnet-4": (ChatAnthropic, dict(
                         model="claude-sonnet-4-20250514",  # Latest Sonnet 4
                         api_key=self.config.anthropic_api_key,
                         max_retries=0,
                         timeout=90  # More time for advanced reasoning
-                    ),
-                    "claude-opus-4": ChatAnthropic(
+                    )),
+                    "claude-opus-4": (ChatAnthropic, dict(
                         model="claude-opus-4-20250514",  # Latest Opus 4
                         api_key=self.config.anthropic_api_key,
                         max_retries=0,
                         timeout=120  # Most advanced model needs more time
-                    ),
-                    "claude-3-5-sonnet": ChatAnthropic(
+                    )),
+                    "claude-3-5-sonnet": (ChatAnthropic, dict(
                         model="claude-3-5-sonnet-20241022",  # Latest 3.5 Sonnet
                         api_key=self.config.anthropic_api_key,
                         max_retries=0,
                         timeout=60
-                    ),
-                    "claude-3-5-haiku": ChatAnthropic(
+                    )),
+                    "claude-3-5-haiku": (ChatAnthropic, dict(
                         model="claude-3-5-haiku-20241022",  # Latest 3.5 Haiku
                         api_key=self.config.anthropic_api_key,
                         max_retries=0,
                         timeout=60
-                    )
+                    ))
                 })
-                logger.info("Anthropic models initialized")
+                logger.info("Anthropic models registered")
             
             # Groq models (Latest 2025 - ultra-fast)
             if self.config.groq_api_key:
-                self.models.update({
-                    "llama-3.3-70b-versatile": ChatGroq(
+                self.models.register({
+                    "llama-3.3-70b-versatile": (ChatGroq, dict(
                         model="llama-3.3-70b-versatile",  # Latest Llama 3.3 70B
                         api_key=self.config.groq_api_key,
+                        http_client=self._http_client,
                         max_retries=0,
-                        timeout=30
-                    ),
-                    "llama-3.3-70b-specdec": ChatGroq(
+                        timeout=self._client_timeout(30)
+                    )),
+                    "llama-3.3-70b-specdec": (ChatGroq, dict(
                         model="llama-3.3-70b-specdec",  # Speculative decoding version
                         api_key=self.config.groq_api_key,
+                        http_client=self._http_client,
                         max_retries=0,
-                        timeout=20  # Even faster with speculative decoding
-                    ),
-                    "llama-3.1-8b-instant": ChatGroq(
+                        timeout=self._client_timeout(20)  # Even faster with speculative decoding
+                    )),
+                    "llama-3.1-8b-instant": (ChatGroq, dict(
                         model="llama-3.1-8b-instant",  # Fast fallback
                         api_key=self.config.groq_api_key,
+                        http_client=self._http_client,
                         max_retries=0,
-                        timeout=15
-                    ),
-                    "mixtral-8x7b-32768": ChatGroq(
+                        timeout=self._client_timeout(15)
+                    )),
+                    "mixtral-8x7b-32768": (ChatGroq, dict(
                         model="mixtral-8x7b-32768",  # Reliable fallback
                         api_key=self.config.groq_api_key,
+                        http_client=self._http_client,
                         max_retries=0,
-                        timeout=30
-                    )
+                        timeout=self._client_timeout(30)
+                    ))
                 })
-                logger.info("Groq models initialized")
+                logger.info("Groq models registered")
             
             # Mistral AI models (Latest 2025)
             if self.config.mistral_api_key:
-                self.models.update({
-                    "codestral-25.01": ChatMistralAI(
+                self.models.register({
+                    "codestral-25.01": (ChatMistralAI, dict(
                         model="codestral-25.01",  # Latest coding model
                         api_key=self.config.mistral_api_key,
                         max_retries=0,
                         timeout=60
-                    ),
-                    "devstral": ChatMistralAI(
+                    )),
+                    "devstral": (ChatMistralAI, dict(
                         model="devstral",  # Development-optimized model
                         api_key=self.config.mistral_api_key,
                         max_retries=0,
                         timeout=60
-                    ),
-                    "mistral-large-latest": ChatMistralAI(
+                    )),
+                    "mistral-large-latest": (ChatMistralAI, dict(
                         model="mistral-large-latest",  # Latest large model
                         api_key=self.config.mistral_api_key,
                         max_retries=0,
                         timeout=60
-                    ),
-                    "mistral-small-latest": ChatMistralAI(
+                    )),
+                    "mistral-small-latest": (ChatMistralAI, dict(
                         model="mistral-small-latest",  # Efficient fallback
                         api_key=self.config.mistral_api_key,
                         max_retries=0,
                         timeout=60
-                    )
+                    ))
                 })
-                logger.info("Mistral AI models initialized")
+                logger.info("Mistral AI models registered")
             
             # Cohere models
             if self.config.cohere_api_key:
-                self.models.update({
-                    "command-r-plus": ChatCohere(
+                self.models.register({
+                    "command-r-plus": (ChatCohere, dict(
                         model="command-r-plus",
                         cohere_api_key=self.config.cohere_api_key,
                         max_retries=0,
                         timeout=60
-                    ),
-                    "command-r": ChatCohere(
+                    )),
+                    "command-r": (ChatCohere, dict(
                         model="command-r",
                         cohere_api_key=self.config.cohere_api_key,
                         max_retries=0,
                         timeout=60
-                    )
+                    ))
                 })
-                logger.info("Cohere models initialized")
+                logger.info("Cohere models registered")
             
             # AWS Bedrock (if in AWS environment)
             if ChatBedrock and self._is_aws_environment():
-                self.models.update({
-                    "anthropic.claude-3-5-sonnet-20241022-v2:0": ChatBedrock(
+                self.models.register({
+                    "anthropic.claude-3-5-sonnet-20241022-v2:0": (ChatBedrock, dict(
                         model_id="anthropic.claude-3-5-sonnet-20241022-v2:0",
                         region_name=self.config.aws_region
-                    ),
-                    "anthropic.claude-3-5-haiku-20241022-v1:0": ChatBedrock(
+                    )),
+                    "anthropic.claude-3-5-haiku-20241022-v1:0": (ChatBedrock, dict(
                         model_id="anthropic.claude-3-5-haiku-20241022-v1:0",
                         region_name=self.config.aws_region
-                    )
+                    ))
                 })
-                logger.info("AWS Bedrock models initialized")
+                logger.info("AWS Bedrock models registered")
             
             # Google Vertex AI (Latest 2025)
             if ChatVertexAI and self.config.google_project_id:
-                self.models.update({
-                    "gemini-2.5-flash": ChatVertexAI(
+                self.models.register({
+                    "gemini-2.5-flash": (ChatVertexAI, dict(
                         model="gemini-2.5-flash",  # Latest Gemini 2.5 Flash
                         project=self.config.google_project_id,
                         location=self.config.google_location,
                         max_retries=0,
                         timeout=60
-                    ),
-                    "gemini-2.0-flash": ChatVertexAI(
+                    )),
+                    "gemini-2.0-flash": (ChatVertexAI, dict(
                         model="gemini-2.0-flash",  # Gemini 2.0 Flash
                         project=self.config.google_project_id,
                         location=self.config.google_location,
                         max_retries=0,
                         timeout=60
-                    ),
-                    "gemini-2.0-flash-lite": ChatVertexAI(
+                    )),
+                    "gemini-2.0-flash-lite": (ChatVertexAI, dict(
                         model="gemini-2.0-flash-lite",  # Lightweight version
                         project=self.config.google_project_id,
                         location=self.config.google_location,
                         max_retries=0,
                         timeout=45
-                    ),
-                    "gemini-1.5-pro": ChatVertexAI(
+                    )),
+                    "gemini-1.5-pro": (ChatVertexAI, dict(
                         model="gemini-1.5-pro",  # Reliable fallback
                         project=self.config.google_project_id,
                         location=self.config.google_location,
                         max_retries=0,
                         timeout=60
-                    )
+                    ))
                 })
-                logger.info("Google Vertex AI models initialized")
+                logger.info("Google Vertex AI models registered")
             
             if not self.models:
                 raise ConfigurationError("No LLM models configured. Please check your API keys.")
             
-            logger.info(f"Total models initialized: {len(self.models)}")
+            logger.info(f"Total models registered: {len(self.models)}")
                 
         except Exception as e:
             logger.error(f"Error initializing models: {e}")
             raise ConfigurationError(f"Model initialization failed: {e}")
     
+    def _build_http_client(self) -> Any:
+        """
+        Build the pooled HTTP client shared by the OpenAI and Groq models.
+        
+        Each SDK client otherwise owns its own connection pool, so a request to
+        one model could not reuse a connection another model of the same
+        provider already opened. Sharing one client keeps warm keep-alive
+        connections per provider host across all of its models.
+        
+        Returns:
+            httpx.Client, or None to let each SDK build its own client
+        """
+        if not HTTPX_AVAILABLE:
+            return None
+        return httpx.Client(limits=httpx.Limits(
+            max_keepalive_connections=self.config.connection_pool_size,
+            keepalive_expiry=60
+        ))
+    
+    def _client_timeout(self, read_timeout: float) -> Any:
+        """
+        Build a client timeout that fails fast on unreachable endpoints.
+        
+        The connect timeout is kept short so a dead endpoint hands over to the
+        next fallback quickly, while the read timeout stays long enough for
+        non-streaming completions, which only arrive once fully generated.
+        
+        Args:
+            read_timeout: Read timeout in seconds
+        
+        Returns:
+            httpx.Timeout for httpx-based clients, or the plain read timeout
+        """
+        if not HTTPX_AVAILABLE:
+            return read_timeout
+        return httpx.Timeout(read_timeout, connect=self.config.provider_connect_timeout_seconds)
+    
+    def _initialize_model_metadata(self) -> None:
+        """Resolve each model's provider and seed its statistics with cost priors."""
+        input_tokens, output_tokens = TYPICAL_CALL_TOKENS
+        
+        for name in self.models:
+            self.model_providers[name] = next(
+                provider for model_class, provider in MODEL_CLASS_PROVIDERS.items()
+                if issubclass(self.models.model_class(name), model_class)
+            )
+            
+            input_price, output_price = MODEL_PRICING_PER_1M.get(name, (0.0, 0.0))
+            cost_per_call = (input_price * input_tokens + output_price * output_tokens) / 1_000_000
+            self.model_stats[name] = ModelStats(cost_per_call_usd=cost_per_call)
+    
     def _create_fallback_chains(self) -> None:
-        """Create pre-configured fallback chains using LangChain's with_fallbacks()."""
-        
-        # Cost-optimized chain (cheapest first)
-        cost_optimized_models = self._get_models_by_cost()
-        if cost_optimized_models:
-            primary = cost_optimized_models[0]
-            fallbacks = cost_optimized_models[1:3]  # Top 3 cheapest
-            if fallbacks:
-                self.fallback_chains["cost_optimized"] = primary.with_fallbacks(fallbacks)
-            else:
-                self.fallback_chains["cost_optimized"] = primary
-        
-        # Performance-optimized chain (fastest first)
-        performance_models = self._get_models_by_performance()
-        if performance_models:
-            primary = performance_models[0]
-            fallbacks = performance_models[1:3]  # Top 3 fastest
-            if fallbacks:
-                self.fallback_chains["performance_optimized"] = primary.with_fallbacks(fallbacks)
-            else:
-                self.fallback_chains["performance_optimized"] = primary
-        
-        # Quality-optimized chain (best models first)
-        quality_models = self._get_models_by_quality()
-        if quality_models:
-            primary = quality_models[0]
-            fallbacks = quality_models[1:3]  # Top 3 quality
-            if fallbacks:
-                self.fallback_chains["quality_optimized"] = primary.with_fallbacks(fallbacks)
-            else:
-                self.fallback_chains["quality_optimized"] = primary
-        
-        # Balanced chain (good balance of cost/performance/quality)
-        balanced_models = self._get_balanced_models()
-        if balanced_models:
-            primary = balanced_models[0]
-            fallbacks = balanced_models[1:4]  # Top 4 balanced
-            if fallbacks:
-                self.fallback_chains["balanced"] = primary.with_fallbacks(fallbacks)
-            else:
-                self.fallback_chains["balanced"] = primary
-        
-        # Default chain (priority order)
-        default_models = self._get_default_priority_models()
-        if default_models:
-            primary = default_models[0]
-            fallbacks = default_models[1:5]  # Top 5 overall
-            if fallbacks:
-                self.fallback_chains["priority_order"] = primary.with_fallbacks(fallbacks)
-            else:
-                self.fallback_chains["priority_order"] = primary
+        """
+        Configure the pre-defined fallback chain orders.
+        
+        The chains themselves are built with with_fallbacks() on first use,
+        so only the models of chains that receive traffic are constructed.
+        """
+        chain_orders = {
+            "cost_optimized": self._get_models_by_cost()[:3],  # Top 3 by success per dollar
+            "performance_optimized": self._get_models_by_performance()[:3],  # Top 3 fastest
+            "quality_optimized": self._get_models_by_quality()[:3],  # Top 3 quality
+            "balanced": self._get_balanced_models()[:4],  # Top 4 balanced
+            "priority_order": self._get_default_priority_models()[:5],  # Top 5 overall
+        }
+        
+        for chain_name, model_names in chain_orders.items():
+            if model_names:
+                self.chain_orders[chain_name] = model_names
+        
+        logger.info(f"Configured {len(self.chain_orders)} fallback chains")
+    
+    def _build_chain(self, model_names: List[str]) -> Runnable:
+        """
+        Build a fallback chain over the given models, in order.
+        
+        Each model is tagged with its name so FallbackAttemptRecorder can
+        attribute runs to it, since with_fallbacks() does not report which
+        member of the chain handled a request.
+        
+        Args:
+            model_names: Model names, primary first
+        
+        Returns:
+            The primary model with the remaining models as fallbacks
+        """
+        tracked = [self._track_model(name) for name in model_names]
+        primary, fallbacks = tracked[0], tracked[1:]
+        
+        if fallbacks:
+            return primary.with_fallbacks(fallbacks)
+        return primary
+    
+    def _track_model(self, model_name: str) -> Runnable:
+        """
+        Tag a model's runs with its name.
         
-        logger.info(f"Created {len(self.fallback_chains)} fallback chains")
+        Anthropic models are also wrapped so long system prompts are sent as
+        prompt cache breakpoints. The cache_control block is Anthropic-specific,
+        so it is added per model rather than to the shared request messages.
+        Models whose SDKs accept a per-request timeout are wrapped so each
+        call gets a read timeout sized from its max_tokens.
+        """
+        model: Runnable = self.models[model_name]
+        model_class = self.models.model_class(model_name)
+        if issubclass(model_class, ChatAnthropic):
+            model = self._with_prompt_caching(model)
+        if issubclass(model_class, PER_CALL_TIMEOUT_MODEL_CLASSES):
+            model = self._with_adaptive_timeout(model_name, model)
+        return model.with_config(metadata={MODEL_METADATA_KEY: model_name})
+    
+    @staticmethod
+    def _with_prompt_caching(model: Runnable) -> Runnable:
+        """Wrap an Anthropic model so long system prompts are marked for prompt caching."""
+        def invoke_with_cache_breakpoint(messages: List, config: RunnableConfig, **kwargs: Any) -> Any:
+            return model.invoke(_mark_system_prompt_cacheable(messages), config=config, **kwargs)
+        
+        return RunnableLambda(invoke_with_cache_breakpoint)
+    
+    def _with_adaptive_timeout(self, model_name: str, model: Runnable) -> Runnable:
+        """
+        Wrap a model so each call gets a read timeout sized for the request.
+        
+        The timeout is computed when the call is made, from the request's
+        max_tokens and the model's current statistics, so cached chains never
+        hold a stale value.
+        """
+        def invoke_with_timeout(messages: List, config: RunnableConfig, **kwargs: Any) -> Any:
+            timeout = self._adaptive_timeout(model_name, kwargs.get("max_tokens"))
+            if timeout is not None:
+                kwargs["timeout"] = self._client_timeout(timeout)
+            return model.invoke(messages, config=config, **kwargs)
+        
+        return RunnableLambda(invoke_with_timeout)
+    
+    def _adaptive_timeout(self, model_name: str, max_tokens: Optional[int]) -> Optional[float]:
+        """
+        Get a per-attempt read timeout sized from the model's generation speed.
+        
+        The timeout is TIMEOUT_HEADROOM times the estimated p99 seconds per
+        output token, times the tokens the request may generate. It is never
+        shorter than PROVIDER_TIMEOUT_MIN_SECONDS, which also covers time to
+        first token, and never longer than the model's configured timeout, so
+        it can only make a stalled call fail over sooner.
+        
+        Args:
+            model_name: Model to size the timeout for
+            max_tokens: Maximum output tokens of the request
+        
+        Returns:
+            Timeout in seconds, or None to keep the model's configured timeout
+        """
+        stats = self.model_stats[model_name]
+        if not max_tokens or stats.token_rate_samples < MIN_TOKEN_RATE_SAMPLES:
+            return None
+        
+        configured = self._configured_read_timeout(model_name)
+        if configured is None:
+            return None
+        
+        timeout = TIMEOUT_HEADROOM * stats.seconds_per_token_p99 * max_tokens
+        return min(max(timeout, self.config.provider_timeout_min_seconds), configured)
     
-    def _get_models_by_cost(self) -> List[BaseChatModel]:
-        """Get models ordered by cost (cheapest first)."""
-        cost_priorities = [
+    def _configured_read_timeout(self, model_name: str) -> Optional[float]:
+        """Get the read timeout a model was registered with, if it has one."""
+        timeout = self.models.model_settings(model_name).get("timeout")
+        if HTTPX_AVAILABLE and isinstance(timeout, httpx.Timeout):
+            return timeout.read
+        if isinstance(timeout, (int, float)):
+            return float(timeout)
+        return None
+    
+    def _hedge_delay(self, model_name: str) -> float:
+        """
+        Get how long to wait for a primary model before hedging, in seconds.
+        
+        Once the model has enough successful calls this is its estimated p95
+        latency, so only its slowest few percent of calls get hedged;
+        until then the configured hedge delay is used.
+        
+        Args:
+            model_name: Primary model of the hedged request
+        
+        Returns:
+            Hedge delay in seconds
+        """
+        stats = self.model_stats[model_name]
+        if stats.successes < MIN_LATENCY_SAMPLES:
+            return self.config.hedge_delay_ms / 1000
+        return stats.latency_p95
+    
+    def is_circuit_open(self, provider: LLMProvider) -> bool:
+        """Check whether a provider is currently marked as out of service."""
+        return time.monotonic() < self._provider_outage.get(provider, 0.0)
+    
+    def record_attempt(
+        self,
+        model_name: str,
+        error: Optional[BaseException],
+        latency: float,
+        completion_tokens: int = 0
+    ) -> None:
+        """
+        Record the outcome of a single model attempt.
+        
+        Connection-class errors open the provider's circuit for the configured
+        cooldown, so remaining candidates on the same provider are skipped
+        instead of each waiting out its own timeout.
+        
+        Args:
+            model_name: Model that was attempted
+            error: Exception raised by the attempt, or None on success
+            latency: Attempt latency in seconds
+            completion_tokens: Output tokens a successful attempt generated
+        """
+        self.model_stats[model_name].record(
+            success=error is None, latency=latency, completion_tokens=completion_tokens
+        )
+        
+        if _is_provider_outage(error):
+            provider = self.model_providers[model_name]
+            cooldown = self.config.provider_outage_cooldown_seconds
+            self._provider_outage[provider] = time.monotonic() + cooldown
+            logger.warning(
+                f"Opening circuit for provider {provider.value} for {cooldown}s "
+                f"after {type(error).__name__} from {model_name}"
+            )
+    
+    def _maybe_reorder_chains(self) -> None:
+        """
+        Refresh chains from model statistics every CHAIN_REORDER_INTERVAL requests.
+        
+        The stats-ordered chains are re-sorted, and every built chain is
+        dropped so it is rebuilt on next use in its current order.
+        """
+        self._requests_since_reorder += 1
+        if self._requests_since_reorder < CHAIN_REORDER_INTERVAL:
+            return
+        
+        self._requests_since_reorder = 0
+        cost_order = self._get_models_by_cost()[:3]
+        if cost_order:
+            self.chain_orders["cost_optimized"] = cost_order
+            logger.debug(f"Reordered cost_optimized chain: {cost_order}")
+        
+        self.fallback_chains = {}
+        self._chain_cache.clear()
+        self._specific_fallbacks.clear()
+        with self._bound_chains_lock:
+            self._bound_chains.clear()
+    
+    def _get_models_by_cost(self) -> List[str]:
+        """Get cost-efficient model names ordered by success per dollar (best p/c first)."""
+        cost_candidates = [
             "llama-3.1-8b-instant",      # Groq - Ultra cheap
             "llama-3.3-70b-specdec",     # Groq - Fast & cheap (2025)
             "llama-3.3-70b-versatile",   # Groq - Cheap (2025)
@@ -331,10 +1036,11 @@ class LangChainProvider:
             "gemini-2.0-flash",          # Google - Flash (2025)
         ]
         
-        return [self.models[name] for name in cost_priorities if name in self.models]
+        available = [name for name in cost_candidates if name in self.models]
+        return sorted(available, key=lambda name: self.model_stats[name].score, reverse=True)
     
-    def _get_models_by_performance(self) -> List[BaseChatModel]:
-        """Get models ordered by performance (fastest first)."""
+    def _get_models_by_performance(self) -> List[str]:
+        """Get model names ordered by performance (fastest first)."""
         performance_priorities = [
             "llama-3.3-70b-specdec",     # Groq - Ultra fast with speculative decoding (2025)
             "llama-3.1-8b-instant",      # Groq - Ultra fast
@@ -346,10 +1052,10 @@ class LangChainProvider:
             "mixtral-8x7b-32768",        # Groq - Fast
         ]
         
-        return [self.models[name] for name in performance_priorities if name in self.models]
+        return [name for name in performance_priorities if name in self.models]
     
-    def _get_models_by_quality(self) -> List[BaseChatModel]:
-        """Get models ordered by quality (best first)."""
+    def _get_models_by_quality(self) -> List[str]:
+        """Get model names ordered by quality (best first)."""
         quality_priorities = [
             "claude-opus-4",             # Anthropic - Highest quality (2025)
             "claude-sonnet-4",           # Anthropic - Excellent quality (2025)
@@ -363,10 +1069,10 @@ class LangChainProvider:
             "llama-3.3-70b-versatile",   # Groq - Large (2025)
         ]
         
-        return [self.models[name] for name in quality_priorities if name in self.models]
+        return [name for name in quality_priorities if name in self.models]
     
-    def _get_balanced_models(self) -> List[BaseChatModel]:
-        """Get models with good balance of cost/performance/quality."""
+    def _get_balanced_models(self) -> List[str]:
+        """Get model names with good balance of cost/performance/quality."""
         balanced_priorities = [
             "gpt-4o-mini",               # OpenAI - Great balance
             "claude-3-5-haiku",          # Anthropic - Fast & good
@@ -377,10 +1083,10 @@ class LangChainProvider:
             "mistral-small-latest",      # Mistral - Efficient
         ]
         
-        return [self.models[name] for name in balanced_priorities if name in self.models]
+        return [name for name in balanced_priorities if name in self.models]
     
-    def _get_default_priority_models(self) -> List[BaseChatModel]:
-        """Get models in default priority order."""
+    def _get_default_priority_models(self) -> List[str]:
+        """Get model names in default priority order."""
         default_priorities = [
             "gpt-4o-mini",               # OpenAI - Best default
             "claude-3-5-haiku",          # Anthropic - Fast backup
@@ -391,11 +1097,10 @@ class LangChainProvider:
             "mistral-small-latest",      # Mistral - Backup
         ]
         
-        return [self.models[name] for name in default_priorities if name in self.models]
+        return [name for name in default_priorities if name in self.models]
     
     def _is_aws_environment(self) -> bool:
         """Check if running in AWS environment."""
-        import os
         return (
             os.getenv('AWS_LAMBDA_FUNCTION_NAME') is not None or
             os.getenv('AWS_EXECUTION_ENV') is not None
@@ -412,14 +1117,26 @@ class LangChainProvider:
         Returns:
             Response data dictionary
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        self._maybe_reorder_chains()
+        recorder = FallbackAttemptRecorder(self)
         
         try:
             # Get the appropriate fallback chain
-            chain = self._get_fallback_chain(request)
+            chain_key, model_names = self._get_chain_order(request)
+            order = self._get_active_order(chain_key, model_names)
+            hedged = request.hedge_enabled and len(order) > 1
+            
+            if hedged:
+                # Primary alone, raced by the rest of the chain once it is slow
+                chains = [self._get_cached_chain(order[:1]), self._get_cached_chain(order[1:])]
+            else:
+                chains = [self._get_fallback_chain(chain_key, model_names, order)]
+            
+            structured = bool(request.structured_output_enabled and request.structured_output_schema)
             
             # Build messages
-            messages = self._build_messages(request)
+            messages = self._build_messages(request, structured)
             
             # Configure model parameters
             model_kwargs = {
@@ -431,27 +1148,27 @@ class LangChainProvider:
             if request.top_k:
                 model_kwargs["top_k"] = request.top_k
             
-            # Configure the chain with parameters
-            configured_chain = chain.bind(**model_kwargs)
-            
-            # Handle structured output
-            if request.structured_output_enabled and request.structured_output_schema:
-                parser = JsonOutputParser()
-                final_chain = configured_chain | parser
-                
-                # Add JSON instruction to the last message
-                json_instruction = f"\n\nPlease respond with valid JSON matching this schema: {request.structured_output_schema}"
-                messages[-1].content += json_instruction
-            else:
-                final_chain = configured_chain
+            # Configure the chains with parameters, parsing JSON for structured output
+            final_chains = [self._get_bound_chain(chain, model_kwargs, structured) for chain in chains]
             
             logger.info(f"Processing request {request_id} with LangChain fallback chain")
             
-            # Execute the chain - LangChain handles all fallback logic
-            response = final_chain.invoke(messages)
+            if hedged:
+                response = self._invoke_hedged(
+                    final_chains[0], final_chains[1], messages, recorder, self._hedge_delay(order[0])
+                )
+            else:
+                # Execute the chain - LangChain handles all fallback logic
+                response = final_chains[0].invoke(messages, config={"callbacks": [recorder]})
             
             # Calculate metrics
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
+            
+            # Token usage comes from the recorder, since a parsed structured
+            # response no longer carries the model's message metadata
+            succeeded = next((attempt for attempt in reversed(recorder.attempts) if attempt.success), None)
+            usage = recorder.usage.get(succeeded.model) if succeeded else None
+            usage = usage or dict.fromkeys(TOKEN_USAGE_KEYS, 0)
             
             # Build response
             if request.structured_output_enabled:
@@ -460,88 +1177,293 @@ class LangChainProvider:
                     "structured_data": response,
                     "total_latency": total_time,
                     "provider_latency": total_time,
-                    "total_tokens": getattr(response, 'usage', {}).get('total_tokens', 0),
-                    "prompt_tokens": getattr(response, 'usage', {}).get('prompt_tokens', 0),
-                    "completion_tokens": getattr(response, 'usage', {}).get('completion_tokens', 0),
-                    "total_cost": self._estimate_cost(request, 0)  # Will be calculated properly
+                    **usage,
+                    "total_cost": succeeded.cost if succeeded else 0.0
                 }
             else:
                 result = {
                     "content": response.content if hasattr(response, 'content') else str(response),
                     "total_latency": total_time,
                     "provider_latency": total_time,
-                    "total_tokens": getattr(response, 'usage', {}).get('total_tokens', 0),
-                    "prompt_tokens": getattr(response, 'usage', {}).get('prompt_tokens', 0),
-                    "completion_tokens": getattr(response, 'usage', {}).get('completion_tokens', 0),
-                    "total_cost": self._estimate_cost(request, 0)  # Will be calculated properly
+                    **usage,
+                    "total_cost": succeeded.cost if succeeded else 0.0
                 }
             
             # Add metadata about the chain used
             result["chain_type"] = self._get_chain_type_used(request)
-            result["fallback_strategy"] = request.fallback_strategy.value
+            result["fallback_strategy"] = request.fallback_strategy
+            result["fallback_attempts"] = list(recorder.attempts)
+            
+            if succeeded:
+                result["provider_used"] = succeeded.provider
+                result["model_used"] = succeeded.model
+                self._update_active_head(chain_key, model_names, succeeded.model)
             
             logger.info(f"Request {request_id} completed successfully in {total_time:.2f}s")
             
             return result
             
         except Exception as e:
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             logger.error(f"Request {request_id} failed after {total_time:.2f}s: {e}")
             
-            raise ProviderError(
-                f"LangChain fallback chain failed: {str(e)}",
-                provider="langchain",
-                details={
-                    "request_id": request_id,
-                    "total_time": total_time,
-                    "chain_type": self._get_chain_type_used(request),
-                    "available_chains": list(self.fallback_chains.keys())
-                }
-            )
+            message = f"LangChain fallback chain failed: {str(e)}"
+            details = {
+                "request_id": request_id,
+                "total_time": total_time,
+                "chain_type": self._get_chain_type_used(request),
+                "available_chains": list(self.chain_orders.keys()),
+                "models_tried": [attempt.model for attempt in recorder.attempts]
+            }
+            
+            status_code = self._upstream_status_code(e)
+            error_class = HTTP_STATUS_ERRORS.get(status_code) if status_code is not None else None
+            if error_class:
+                raise error_class(message, details=details) from e
+            
+            raise ProviderError(message, provider="langchain", details=details) from e
     
-    def _get_fallback_chain(self, request: RequestSchema) -> Union[RunnableWithFallbacks, BaseChatModel]:
-        """Get the appropriate fallback chain based on request."""
+    def _invoke_hedged(
+        self,
+        primary: Runnable,
+        fallback: Runnable,
+        messages: List,
+        recorder: FallbackAttemptRecorder,
+        hedge_delay: float
+    ) -> Any:
+        """
+        Invoke the primary, racing the fallback chain against it once it is slow.
         
+        The primary is started on the hedge pool. If it has not answered after
+        hedge_delay seconds, the fallback chain is started alongside it, and
+        whichever branch succeeds first wins; the other is cancelled if it has
+        not started, or left to finish in the background. A primary that fails
+        before hedge_delay hands over to the fallback chain straight away.
+        
+        Each branch records into its own recorder, merged into recorder once
+        the race is decided: the winner's attempts last, so the response
+        reports its model, and the loser's unfinished attempt as abandoned.
+        
+        Args:
+            primary: Configured primary model runnable
+            fallback: Configured runnable for the rest of the chain
+            messages: Messages to send
+            recorder: Attempt recorder for the request
+            hedge_delay: Seconds to wait for the primary before hedging
+        
+        Returns:
+            Response from the first branch to succeed
+        """
+        branches: Dict[Future, FallbackAttemptRecorder] = {}
+        
+        def start(runnable: Runnable) -> Future:
+            branch_recorder = FallbackAttemptRecorder(self)
+            future = self._hedge_executor.submit(runnable.invoke, messages, {"callbacks": [branch_recorder]})
+            branches[future] = branch_recorder
+            return future
+        
+        winner: Optional[Future] = None
+        try:
+            primary_future = start(primary)
+            done, _ = wait([primary_future], timeout=hedge_delay)
+            if done and primary_future.exception() is None:
+                winner = primary_future
+            else:
+                if done:
+                    logger.info("Primary failed, handing over to the fallback chain")
+                else:
+                    logger.info(f"Primary slower than {hedge_delay:.2f}s, hedging with fallback chain")
+                start(fallback)
+                winner = self._first_success(list(branches))
+            return winner.result()
+        finally:
+            for future, branch_recorder in branches.items():
+                if future is not winner:
+                    future.cancel()
+                    recorder.merge(branch_recorder)
+            if winner is not None:
+                recorder.merge(branches[winner])
+    
+    @staticmethod
+    def _first_success(futures: List[Future]) -> Future:
+        """Wait for the first future to succeed, raising the last error if all fail."""
+        pending = set(futures)
+        errors: List[BaseException] = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    return future
+                errors.append(error)
+        raise errors[-1]
+    
+    @staticmethod
+    def _upstream_status_code(error: BaseException) -> Optional[int]:
+        """Get the HTTP status of a provider SDK error, if it carries one."""
+        if HTTPX_AVAILABLE and isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code
+        # OpenAI, Anthropic and Groq SDK errors expose the status directly
+        return getattr(error, "status_code", None)
+    
+    def _get_chain_order(self, request: RequestSchema) -> Tuple[str, List[str]]:
+        """
+        Get the chain key and ordered model names to use for a request.
+        
+        Args:
+            request: Validated request schema
+        
+        Returns:
+            Tuple of (chain key, model names with the primary first)
+        """
         # If specific model requested, try to get it directly
         if request.model_name and request.model_name in self.models:
-            primary_model = self.models[request.model_name]
+            model_names = [request.model_name]
             
             if request.enable_fallback:
                 # Create a custom fallback chain for this specific model
-                fallback_models = self._get_fallback_models_for_specific(request.model_name, request.fallback_strategy)
-                if fallback_models:
-                    return primary_model.with_fallbacks(fallback_models)
+                model_names += self._get_fallback_models_for_specific(request.model_name, request.fallback_strategy)
             
-            return primary_model
+            return f"specific_model_{request.model_name}_{request.fallback_strategy}", model_names
+        
+        if not self.models:
+            raise ProviderError("No models available", provider="langchain")
         
         # Use pre-configured fallback chains based on strategy
         if not request.enable_fallback:
             # No fallback - use first available model
-            if self.models:
-                return list(self.models.values())[0]
+            return "no_fallback", [next(iter(self.models))]
+        
+        # Get chain based on fallback strategy, then fall back to default chains
+        for chain_name in (request.fallback_strategy, "balanced", "priority_order"):
+            if chain_name in self.chain_orders:
+                return chain_name, self.chain_orders[chain_name]
+        
+        # Last resort - use first available model
+        return "no_fallback", [next(iter(self.models))]
+    
+    def _get_active_order(self, chain_key: str, model_names: List[str]) -> List[str]:
+        """
+        Get the model order for a chain, starting from its sticky active head.
+        
+        Once a fallback has succeeded, later requests start from it instead of
+        re-trying a failing primary first; the skipped models stay at the end
+        of the chain. Every primary_probe_interval_seconds one request is sent
+        through the original order to probe whether the primary has recovered.
+        
+        Args:
+            chain_key: Chain identifier
+            model_names: Model names in original order, primary first
+        
+        Returns:
+            Model names in the order to try them for this request
+        """
+        head = self._active_head.get(chain_key)
+        
+        if head is not None:
+            probe_due = (
+                time.monotonic() - self._head_probed_at[chain_key]
+                >= self.config.primary_probe_interval_seconds
+            )
+            if probe_due or head not in model_names:
+                # Let this request go through the original order
+                self._head_probed_at[chain_key] = time.monotonic()
             else:
-                raise ProviderError("No models available")
+                index = model_names.index(head)
+                return model_names[index:] + model_names[:index]
         
-        # Get chain based on fallback strategy
-        strategy_name = request.fallback_strategy.value
+        return model_names
+    
+    def _get_fallback_chain(self, chain_key: str, model_names: List[str], order: List[str]) -> Runnable:
+        """
+        Get the runnable for a chain in the given order, building it on first use.
         
-        if strategy_name in self.fallback_chains:
-            return self.fallback_chains[strategy_name]
+        Args:
+            chain_key: Chain identifier
+            model_names: Model names in original order, primary first
+            order: Model names in the order to try them
         
-        # Fallback to default chain
-        if "balanced" in self.fallback_chains:
-            return self.fallback_chains["balanced"]
-        elif "priority_order" in self.fallback_chains:
-            return self.fallback_chains["priority_order"]
-        else:
-            # Last resort - use first available model
-            return list(self.models.values())[0]
+        Returns:
+            Runnable chain for the request
+        """
+        if order == model_names and chain_key in self.chain_orders:
+            chain = self.fallback_chains.get(chain_key)
+            if chain is None:
+                chain = self.fallback_chains[chain_key] = self._build_chain(model_names)
+            return chain
+        return self._get_cached_chain(order)
     
-    def _get_fallback_models_for_specific(self, model_name: str, strategy: FallbackStrategy) -> List[BaseChatModel]:
-        """Get fallback models for a specific primary model."""
-        # Get all models except the primary one
-        available_models = {name: model for name, model in self.models.items() if name != model_name}
+    def _get_cached_chain(self, model_names: List[str]) -> Runnable:
+        """Get the chain for a model order, building it only on first use."""
+        key = tuple(model_names)
+        chain = self._chain_cache.get(key)
+        if chain is None:
+            chain = self._chain_cache[key] = self._build_chain(model_names)
+        return chain
+    
+    def _get_bound_chain(self, chain: Runnable, model_kwargs: Dict[str, Any], structured: bool) -> Runnable:
+        """
+        Get a chain bound to sampling parameters, reusing an earlier binding.
+        
+        Structured-output requests get the binding piped into the shared JSON
+        parser, cached under its own key.
+        
+        Most traffic uses a handful of parameter combinations, so bindings are
+        kept in a small LRU instead of being rebuilt on every request. Each
+        binding holds a reference to its chain, so the chain's id in the key
+        cannot be reused while the entry exists.
+        
+        Args:
+            chain: Fallback chain to bind
+            model_kwargs: Sampling parameters for the request
+            structured: Whether to parse the response as JSON
+        
+        Returns:
+            The chain bound to model_kwargs
+        """
+        key = (id(chain), structured, *sorted(model_kwargs.items()))
+        with self._bound_chains_lock:
+            bound = self._bound_chains.get(key)
+            if bound is not None:
+                self._bound_chains.move_to_end(key)
+                return bound
+            
+            bound = chain.bind(**model_kwargs)
+            if structured:
+                bound = bound | self._json_parser
+            self._bound_chains[key] = bound
+            if len(self._bound_chains) > BOUND_CHAIN_CACHE_SIZE:
+                self._bound_chains.popitem(last=False)
+            return bound
+    
+    def _update_active_head(self, chain_key: str, model_names: List[str], model_used: str) -> None:
+        """Pin a chain to the fallback that succeeded, or unpin it once the primary answers."""
+        if model_used == model_names[0]:
+            if self._active_head.pop(chain_key, None) is not None:
+                logger.info(f"Primary {model_used} recovered, unpinning {chain_key} chain")
+        elif model_used != self._active_head.get(chain_key):
+            # Stamp the probe time first: _get_active_order reads it for any
+            # head it sees, and batch items run on concurrent threads
+            self._head_probed_at[chain_key] = time.monotonic()
+            self._active_head[chain_key] = model_used
+            logger.info(f"Pinning {chain_key} chain to fallback {model_used}")
+    
+    def _get_fallback_models_for_specific(self, model_name: str, strategy: str) -> List[str]:
+        """
+        Get fallback model names for a specific primary model.
         
+        The result is memoized per (model, strategy) until the next chain
+        reorder, so the cost ordering is re-sorted on the same schedule as the
+        cost_optimized chain instead of on every request.
+        """
+        key = (model_name, strategy)
+        fallbacks = self._specific_fallbacks.get(key)
+        if fallbacks is None:
+            fallbacks = self._specific_fallbacks[key] = self._rank_fallbacks_for_specific(model_name, strategy)
+        return fallbacks
+    
+    def _rank_fallbacks_for_specific(self, model_name: str, strategy: str) -> List[str]:
+        """Rank fallback model names for a specific primary model."""
         if strategy == FallbackStrategy.COST_OPTIMIZED:
             fallback_order = self._get_models_by_cost()
         elif strategy == FallbackStrategy.PERFORMANCE_OPTIMIZED:
@@ -550,16 +1472,38 @@ class LangChainProvider:
             fallback_order = self._get_default_priority_models()
         
         # Return models that are available and not the primary
-        return [model for model in fallback_order if model in available_models.values()][:3]
+        return [name for name in fallback_order if name != model_name][:3]
     
-    def _build_messages(self, request: RequestSchema) -> List:
-        """Build LangChain messages from request."""
-        messages = []
+    def _build_messages(self, request: RequestSchema, structured: bool) -> List:
+        """
+        Build LangChain messages from request, with canonicalized prompts.
+        
+        For structured output the JSON instruction goes into the system
+        message, after the system prompt. It only changes with the schema, so
+        keeping it ahead of the user prompt leaves the dynamic content last and
+        the prefix cacheable across requests.
+        
+        Args:
+            request: Validated request schema
+            structured: Whether to instruct the model to answer in JSON
         
+        Returns:
+            System message (if any) followed by the user message
+        """
+        system_parts = []
         if request.system_prompt:
-            messages.append(SystemMessage(content=request.system_prompt))
+            system_parts.append(_canonicalize_prompt(request.system_prompt))
+        
+        if structured:
+            # Sorted keys keep the instruction identical for equal schemas
+            schema = orjson.dumps(request.structured_output_schema, option=orjson.OPT_SORT_KEYS).decode()
+            system_parts.append(f"Please respond with valid JSON matching this schema: {schema}")
         
-        messages.append(HumanMessage(content=request.prompt))
+        messages: List[BaseMessage] = []
+        if system_parts:
+            messages.append(SystemMessage(content="\n\n".join(system_parts)))
+        
+        messages.append(HumanMessage(content=_canonicalize_prompt(request.prompt)))
         
         return messages
     
@@ -571,20 +1515,45 @@ class LangChainProvider:
         if not request.enable_fallback:
             return "no_fallback"
         
-        return request.fallback_strategy.value
+        return request.fallback_strategy
     
-    def _estimate_cost(self, request: RequestSchema, tokens: int) -> float:
-        """Estimate cost for the request (simplified)."""
-        # This would need proper implementation based on actual usage
-        # For now, return a minimal estimate
-        return 0.001  # $0.001 baseline
+    def calculate_cost(self, model_name: str, usage: Dict[str, int]) -> Optional[float]:
+        """
+        Calculate the cost of a completed call from its token usage.
+        
+        Prompt tokens read from or written to the provider's prompt cache are
+        billed at that provider's cache read/write rates instead of the base
+        input price.
+        
+        Args:
+            model_name: Model that produced the response
+            usage: Token counts keyed by TOKEN_USAGE_KEYS
+        
+        Returns:
+            Cost in USD, or None if the model has no list price
+        """
+        pricing = MODEL_PRICING_PER_1M.get(model_name)
+        if pricing is None:
+            logger.warning(f"No list price for model {model_name}, reporting its cost as unknown")
+            return None
+        
+        input_price, output_price = pricing
+        read_multiplier, write_multiplier = CACHED_INPUT_PRICE_MULTIPLIERS.get(
+            self.model_providers[model_name], (1.0, 1.0)
+        )
+        cache_read = usage["cache_read_input_tokens"]
+        cache_write = usage["cache_creation_input_tokens"]
+        uncached = max(usage["prompt_tokens"] - cache_read - cache_write, 0)
+        
+        input_cost = input_price * (uncached + cache_read * read_multiplier + cache_write * write_multiplier)
+        return (input_cost + output_price * usage["completion_tokens"]) / 1_000_000
     
     def get_available_models(self) -> Dict[str, Any]:
         """Get information about available models and chains."""
         return {
             "total_models": len(self.models),
             "available_models": list(self.models.keys()),
-            "fallback_chains": list(self.fallback_chains.keys()),
+            "fallback_chains": list(self.chain_orders.keys()),
             "models_by_provider": self._group_models_by_provider()
         }
     
@@ -615,15 +1584,34 @@ class LangChainProvider:
         
         return groups
     
+    def _get_provider_status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize each upstream provider from its models and circuit state.
+        
+        Readiness is derived from the outcomes of real traffic recorded by the
+        circuit breaker, so no upstream calls are made per health check.
+        """
+        status: Dict[str, Dict[str, Any]] = {}
+        for provider in self.model_providers.values():
+            entry = status.setdefault(
+                provider.value,
+                {"models": 0, "circuit_open": self.is_circuit_open(provider)}
+            )
+            entry["models"] += 1
+        return status
+    
     def health_check(self) -> Dict[str, Any]:
         """Perform health check on the provider."""
         try:
+            providers = self._get_provider_status()
             return {
-                "healthy": True,
+                "healthy": not all(entry["circuit_open"] for entry in providers.values()),
+                "providers": providers,
                 "total_models": len(self.models),
                 "available_models": list(self.models.keys()),
-                "fallback_chains": list(self.fallback_chains.keys()),
-                "timestamp": datetime.utcnow().isoformat(),
+                "initialized_models": self.models.initialized,
+                "fallback_chains": list(self.chain_orders.keys()),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "langchain_fallback_enabled": True
             }
         except Exception as e:
@@ -631,5 +1619,5 @@ class LangChainProvider:
             return {
                 "healthy": False,
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.now(timezone.utc).isoformat()
             }
\ No newline at end of file
@@ -7,6 +7,7 @@ Configuration management using environment variables and AWS services.
 
 import os
 import logging
+from functools import cached_property
 from typing import Optional, Dict, Any
 import boto3
 import json
@@ -65,12 +66,24 @@ class Config:
         # Performance Configuration
         self.connection_pool_size = int(os.getenv('CONNECTION_POOL_SIZE', '20'))
         self.request_timeout = int(os.getenv('REQUEST_TIMEOUT', '300'))
+        self.api_keys_cache_ttl_seconds = int(os.getenv('API_KEYS_CACHE_TTL_SECONDS', '300'))
+        self.max_batch_size = int(os.getenv('MAX_BATCH_SIZE', '10'))
+        self.provider_outage_cooldown_seconds = int(os.getenv('PROVIDER_OUTAGE_COOLDOWN_SECONDS', '30'))
+        self.primary_probe_interval_seconds = int(os.getenv('PRIMARY_PROBE_INTERVAL_SECONDS', '60'))
+        self.provider_connect_timeout_seconds = float(os.getenv('PROVIDER_CONNECT_TIMEOUT_SECONDS', '5'))
+        self.hedge_delay_ms = int(os.getenv('HEDGE_DELAY_MS', '1000'))
+        self.provider_timeout_min_seconds = float(os.getenv('PROVIDER_TIMEOUT_MIN_SECONDS', '10'))
         
         # Monitoring Configuration
         self.enable_xray_tracing = os.getenv('ENABLE_XRAY_TRACING', 'true').lower() == 'true'
         self.enable_metrics = os.getenv('ENABLE_METRICS', 'true').lower() == 'true'
         self.metrics_namespace = os.getenv('METRICS_NAMESPACE', 'OmniLLM')
         
+    @cached_property
+    def secrets_client(self) -> Any:
+        """Secrets Manager client, created on first use and shared by all lookups."""
+        return boto3.client('secretsmanager', region_name=self.aws_region)
+    
     def _get_secret(self, env_var_name: str, secret_key: Optional[str] = None) -> Optional[str]:
         """
         Get secret value from environment variable or AWS Secrets Manager.
@@ -114,8 +127,7 @@ class Config:
             Secret value or None if not found
         """
         try:
-            secrets_client = boto3.client('secretsmanager', region_name=self.aws_region)
-            response = secrets_client.get_secret_value(SecretId=f"omni-llm/{secret_name}")
+            response = self.secrets_client.get_secret_value(SecretId=f"omni-llm/{secret_name}")
             
             # Try to parse as JSON first
             try:
@@ -0,0 +1,25 @@
+"""
+Shared pytest fixtures for the Omni-LLM test suite.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Import the package as "src", the way the Lambda bundle and test_deployment.py do
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import lambda_function
+
+
+@pytest.fixture
+def api_keys(monkeypatch: pytest.MonkeyPatch) -> str:
+    """Configure client API keys from the environment and start from an empty key cache."""
+    monkeypatch.setenv("OMNI_LLM_API_KEYS", "test-key-12345,other+key/==")
+    monkeypatch.setattr(
+        lambda_function,
+        "_api_keys_cache",
+        {"keys": frozenset(), "loaded_at": None, "refreshing": False}
+    )
+    return "test-key-12345"
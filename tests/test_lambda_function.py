@@ -0,0 +1,117 @@
+"""
+Tests for the Lambda handler and API key validation.
+"""
+
+import time
+from typing import Any, Dict, List
+
+import orjson
+import pytest
+
+from src import lambda_function
+from src.core.exceptions import ProviderError
+from src.lambda_function import lambda_handler, validate_api_key
+from src.models.architecture import RequestSchema
+
+
+class MockContext:
+    """Lambda context carrying only the request ID read by the handler."""
+    aws_request_id = "test-request-123"
+
+
+class FakeRouter:
+    """Router answering with the prompt, after a delay the prompt can set."""
+    
+    def process_request(self, request: RequestSchema, request_id: str) -> Dict[str, Any]:
+        if request.prompt == "fail":
+            raise ProviderError("All models failed", provider="langchain")
+        if request.prompt.startswith("slow"):
+            time.sleep(0.1)
+        return {"success": True, "content": request.prompt, "metadata": {"request_id": request_id}}
+
+
+@pytest.fixture
+def fake_router(monkeypatch: pytest.MonkeyPatch) -> FakeRouter:
+    router = FakeRouter()
+    monkeypatch.setattr(lambda_function, "get_router", lambda: router)
+    return router
+
+
+def invoke(api_key: str, body: List[Dict[str, Any]]) -> Dict[str, Any]:
+    event = {
+        "httpMethod": "POST",
+        "path": "/invoke",
+        "headers": {"x-api-key": api_key},
+        "body": orjson.dumps(body).decode()
+    }
+    return lambda_handler(event, MockContext())
+
+
+def test_validate_api_key_accepts_configured_keys(api_keys: str) -> None:
+    assert validate_api_key(api_keys)
+
+
+def test_validate_api_key_accepts_base64_style_keys(api_keys: str) -> None:
+    assert validate_api_key("other+key/==")
+
+
+def test_validate_api_key_rejects_unknown_keys(api_keys: str) -> None:
+    assert not validate_api_key("unknown-key-12345")
+    assert not validate_api_key("short")
+    assert not validate_api_key(None)
+
+
+def test_lambda_handler_rejects_malformed_base64_body(api_keys: str) -> None:
+    event = {
+        "httpMethod": "POST",
+        "path": "/invoke",
+        "headers": {"x-api-key": api_keys},
+        "body": "eyJwcm9tcHQiOiAiaGkifQ=!",
+        "isBase64Encoded": True
+    }
+    
+    response = lambda_handler(event, MockContext())
+    
+    assert response["statusCode"] == 400
+    assert orjson.loads(response["body"])["error"]["code"] == "VALIDATION_ERROR"
+
+
+def test_batch_responses_keep_input_order(api_keys: str, fake_router: FakeRouter) -> None:
+    prompts = ["slow first", "second", "slow third", "fourth"]
+    
+    response = invoke(api_keys, [{"prompt": prompt} for prompt in prompts])
+    
+    assert response["statusCode"] == 200
+    body = orjson.loads(response["body"])
+    assert body["success"]
+    assert [item["content"] for item in body["responses"]] == prompts
+    assert [item["metadata"]["request_id"] for item in body["responses"]] == [
+        f"test-request-123-{index}" for index in range(len(prompts))
+    ]
+
+
+def test_batch_reports_partial_failure_per_item(api_keys: str, fake_router: FakeRouter) -> None:
+    response = invoke(api_keys, [{"prompt": "ok"}, {"prompt": "fail"}, {"prompt": "also ok"}])
+    
+    assert response["statusCode"] == 200
+    body = orjson.loads(response["body"])
+    assert not body["success"]
+    assert [item["success"] for item in body["responses"]] == [True, False, True]
+    assert body["responses"][1]["error"]["code"] == "PROVIDER_ERROR"
+    assert body["responses"][1]["error"]["request_id"] == "test-request-123-1"
+
+
+def test_batch_over_item_limit_is_rejected(api_keys: str, fake_router: FakeRouter) -> None:
+    max_batch_size = lambda_function.get_config().max_batch_size
+    
+    response = invoke(api_keys, [{"prompt": "hi"}] * (max_batch_size + 1))
+    
+    assert response["statusCode"] == 400
+    assert str(max_batch_size) in orjson.loads(response["body"])["error"]
+
+
+def test_batch_with_invalid_item_is_rejected(api_keys: str, fake_router: FakeRouter) -> None:
+    response = invoke(api_keys, [{"prompt": "hi"}, {"prompt": "hi", "temperature": 5.0}])
+    
+    assert response["statusCode"] == 400
+    assert "temperature" in orjson.loads(response["body"])["error"]
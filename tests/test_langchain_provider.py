@@ -0,0 +1,53 @@
+"""
+Tests for hedged requests in the LangChain provider.
+"""
+
+import time
+
+import pytest
+
+for module in ("langchain_openai", "langchain_anthropic", "langchain_mistralai", "langchain_cohere", "langchain_groq"):
+    pytest.importorskip(module)
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from src.models.architecture import RequestSchema
+from src.providers.langchain_provider import LangChainProvider
+from src.utils.config import Config
+
+
+@pytest.fixture
+def provider(monkeypatch: pytest.MonkeyPatch) -> LangChainProvider:
+    """Provider whose models are fakes answering instantly with their own name."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("HEDGE_DELAY_MS", "100")
+    provider = LangChainProvider(Config())
+    provider.models.register({
+        name: (FakeListChatModel, {"responses": [name]}) for name in provider.models
+    })
+    return provider
+
+
+def test_hedged_request_returns_first_success(provider: LangChainProvider) -> None:
+    provider.models.register({"gpt-4o": (FakeListChatModel, {"responses": ["gpt-4o"], "sleep": 1.0})})
+    request = RequestSchema(prompt="hi", model_name="gpt-4o", hedge_enabled=True)
+    
+    start = time.perf_counter()
+    result = provider.process_request(request, "hedge-test")
+    elapsed = time.perf_counter() - start
+    
+    assert elapsed < 0.8
+    assert result["model_used"] != "gpt-4o"
+    assert result["content"] == result["model_used"]
+    primary_attempts = [attempt for attempt in result["fallback_attempts"] if attempt.model == "gpt-4o"]
+    assert [attempt.error for attempt in primary_attempts] == ["abandoned_by_hedge"]
+
+
+def test_hedged_request_keeps_fast_primary(provider: LangChainProvider) -> None:
+    request = RequestSchema(prompt="hi", model_name="gpt-4o", hedge_enabled=True)
+    
+    result = provider.process_request(request, "hedge-test")
+    
+    assert result["model_used"] == "gpt-4o"
+    assert [attempt.model for attempt in result["fallback_attempts"]] == ["gpt-4o"]